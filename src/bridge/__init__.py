@@ -21,6 +21,7 @@ from src.bridge.protocol import (
     create_error_response,
     create_execute_request,
     create_ping_request,
+    create_ping_request_bytes,
     create_query_request,
     create_success_response,
 )
@@ -47,6 +48,7 @@ __all__ = [
     "create_error_response",
     "create_execute_request",
     "create_ping_request",
+    "create_ping_request_bytes",
     "create_query_request",
     "create_success_response",
 ]
@@ -15,10 +15,12 @@ Features:
 from __future__ import annotations
 
 import contextlib
+import itertools
 import socket
 import struct
 import threading
 import time
+import weakref
 from typing import Any
 
 from src.bridge.exceptions import (
@@ -26,7 +28,6 @@ from src.bridge.exceptions import (
     ConnectionRefusedError,
     ConnectionTimeoutError,
     ExecutionError,
-    MessageFramingError,
     ProtocolError,
 )
 from src.bridge.protocol import (
@@ -34,7 +35,7 @@ from src.bridge.protocol import (
     Request,
     Response,
     create_execute_request,
-    create_ping_request,
+    create_ping_request_bytes,
     create_query_request,
 )
 from src.telemetry.logger import get_logger
@@ -47,7 +48,18 @@ DEFAULT_PORT = 5005
 DEFAULT_TIMEOUT = 10.0  # seconds
 DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds
 HEADER_SIZE = 4  # 4 bytes for message length prefix
+HEADER_STRUCT = struct.Struct(">I")  # Precompiled big-endian length prefix
 NOT_CONNECTED_MSG = "Not connected"
+SEND_BUFFER_SIZE = 1 << 20  # Kernel send buffer (SO_SNDBUF) in bytes
+SEND_POOL_SIZE = 64 * 1024  # Reusable framing buffer for typical messages
+# sendmsg() (scatter/gather send) is unavailable on Windows
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def _close_socket(sock: socket.socket) -> None:
+    """Close a socket left open by a client that was never disconnected."""
+    with contextlib.suppress(OSError):
+        sock.close()
 
 
 class BlenderClient:
@@ -58,6 +70,21 @@ class BlenderClient:
     to prevent message fragmentation issues.
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "timeout",
+        "connect_timeout",
+        "_socket",
+        "_lock",
+        "_connected",
+        "_header_buf",
+        "_send_buf",
+        "_request_ids",
+        "_finalizer",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         host: str = DEFAULT_HOST,
@@ -86,6 +113,13 @@ class BlenderClient:
         self._socket: socket.socket | None = None
         self._lock = threading.Lock()
         self._connected = False
+        self._header_buf = bytearray(HEADER_SIZE)
+        # Framing pool, allocated on first use (only needed without sendmsg)
+        self._send_buf: bytearray | None = None
+        # Ids only need to be unique per client; next() on count is atomic
+        self._request_ids = itertools.count(1)
+        # Closes the socket if the client is garbage collected while connected
+        self._finalizer: weakref.finalize | None = None
 
         logger.debug("BlenderClient initialized")
 
@@ -114,10 +148,16 @@ class BlenderClient:
 
             try:
                 self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                # Small request/response frames: disable Nagle's delay
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE
+                )
                 self._socket.settimeout(self.connect_timeout)
                 self._socket.connect((self.host, self.port))
                 self._socket.settimeout(self.timeout)
                 self._connected = True
+                self._finalizer = weakref.finalize(self, _close_socket, self._socket)
 
                 logger.info(
                     "Connected to Blender",
@@ -170,6 +210,9 @@ class BlenderClient:
 
     def _cleanup_socket(self) -> None:
         """Clean up socket resources (internal, must be called with lock held)."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
         if self._socket:
             with contextlib.suppress(OSError):
                 self._socket.close()
@@ -195,23 +238,64 @@ class BlenderClient:
                 f"Message too large: {len(data)} bytes (max {MAX_MESSAGE_SIZE})"
             )
 
-        # Create length-prefixed message
-        length_prefix = struct.pack(">I", len(data))
-        message = length_prefix + data
-
         logger.debug(
             "Sending message",
-            extra={"data_length": len(data), "total_length": len(message)},
+            extra={"data_length": len(data), "total_length": HEADER_SIZE + len(data)},
         )
 
         try:
-            self._socket.sendall(message)
+            if HAS_SENDMSG:
+                # Hand header and payload to the kernel as one iovec
+                self._sendmsg_all(self._socket, HEADER_STRUCT.pack(len(data)), data)
+            else:
+                self._socket.sendall(self._frame_message(data))
         except OSError as err:
             logger.error("Send failed", extra={"error": str(err)})
             self._cleanup_socket()
             raise ConnectionClosedError(reason=str(err)) from err
 
-    def _receive_message(self) -> bytes:
+    def _frame_message(self, data: bytes) -> memoryview:
+        """
+        Build the length-prefixed frame in a single buffer.
+
+        Messages that fit reuse the client's pooled send buffer, allocated on
+        first use (callers hold the lock); larger ones get a buffer of their own.
+
+        Args:
+            data: Message bytes to frame.
+
+        Returns:
+            View over the framed message.
+        """
+        size = HEADER_SIZE + len(data)
+        if size > SEND_POOL_SIZE:
+            buffer = bytearray(size)
+        else:
+            if self._send_buf is None:
+                self._send_buf = bytearray(SEND_POOL_SIZE)
+            buffer = self._send_buf
+        HEADER_STRUCT.pack_into(buffer, 0, len(data))
+        buffer[HEADER_SIZE:size] = data
+        return memoryview(buffer)[:size]
+
+    @staticmethod
+    def _sendmsg_all(sock: socket.socket, header: bytes, data: bytes) -> None:
+        """
+        Send header and payload with sendmsg, finishing any partial send.
+
+        Args:
+            sock: Connected socket to send on.
+            header: Encoded length prefix.
+            data: Message bytes following the prefix.
+        """
+        sent = sock.sendmsg([header, data])
+        if sent < len(header):
+            sock.sendall(header[sent:])
+            sent = len(header)
+        if sent < len(header) + len(data):
+            sock.sendall(memoryview(data)[sent - len(header) :])
+
+    def _receive_message(self) -> bytes | bytearray:
         """
         Receive a length-prefixed message.
 
@@ -220,22 +304,15 @@ class BlenderClient:
 
         Raises:
             ConnectionClosedError: If connection is closed.
-            MessageFramingError: If message framing is invalid.
             ConnectionTimeoutError: If receive times out.
         """
         if not self._socket:
             raise ConnectionClosedError(reason=NOT_CONNECTED_MSG)
 
         try:
-            # Read length prefix
-            length_bytes = self._recv_exact(HEADER_SIZE)
-            if len(length_bytes) != HEADER_SIZE:
-                raise MessageFramingError(
-                    expected_length=HEADER_SIZE,
-                    actual_length=len(length_bytes),
-                )
-
-            message_length = struct.unpack(">I", length_bytes)[0]
+            # Read length prefix into the reusable header buffer
+            self._recv_into(memoryview(self._header_buf))
+            message_length = HEADER_STRUCT.unpack_from(self._header_buf)[0]
 
             # Validate message size
             if message_length > MAX_MESSAGE_SIZE:
@@ -247,11 +324,6 @@ class BlenderClient:
 
             # Read message body
             message_data = self._recv_exact(message_length)
-            if len(message_data) != message_length:
-                raise MessageFramingError(
-                    expected_length=message_length,
-                    actual_length=len(message_data),
-                )
 
             logger.debug("Received message", extra={"actual_length": len(message_data)})
             return message_data
@@ -263,7 +335,7 @@ class BlenderClient:
                 operation="receive",
             ) from err
 
-    def _recv_exact(self, num_bytes: int) -> bytes:
+    def _recv_exact(self, num_bytes: int) -> bytes | bytearray:
         """
         Receive exactly num_bytes from socket.
 
@@ -271,22 +343,40 @@ class BlenderClient:
             num_bytes: Number of bytes to receive.
 
         Returns:
-            Received bytes.
+            Received bytes, in the buffer they were read into (not copied).
 
         Raises:
             ConnectionClosedError: If connection closes before all bytes received.
         """
+        buffer = bytearray(num_bytes)
+        self._recv_into(memoryview(buffer))
+        return buffer
+
+    def _recv_into(self, view: memoryview) -> None:
+        """
+        Fill a buffer completely from the socket.
+
+        Args:
+            view: Writable view to fill; its length is the number of bytes read.
+
+        Raises:
+            ConnectionClosedError: If connection closes before the view is full.
+        """
         if not self._socket:
             raise ConnectionClosedError(reason=NOT_CONNECTED_MSG)
 
-        data = b""
-        while len(data) < num_bytes:
-            chunk = self._socket.recv(num_bytes - len(data))
-            if not chunk:
+        # Timeout sockets are non-blocking underneath, so reads may be short
+        received = 0
+        while received < len(view):
+            count = self._socket.recv_into(view[received:])
+            if not count:
                 # Connection closed by remote
                 raise ConnectionClosedError(reason="Connection closed by remote")
-            data += chunk
-        return data
+            received += count
+
+    def _next_request_id(self) -> str:
+        """Return the next request id from the client's counter."""
+        return str(next(self._request_ids))
 
     def send_request(self, request: Request) -> Response:
         """
@@ -306,22 +396,38 @@ class BlenderClient:
             "Sending request",
             extra={"id": request.id, "method": request.method.value},
         )
+        return self._exchange(request.to_bytes(), request.id)
+
+    def _exchange(self, payload: bytes, request_id: str) -> Response:
+        """
+        Send a serialized request and wait for its response.
+
+        Args:
+            payload: Serialized request.
+            request_id: Id of the serialized request.
 
+        Returns:
+            Response from Blender.
+
+        Raises:
+            ConnectionClosedError: If not connected.
+            ProtocolError: If response is invalid.
+        """
         with self._lock:
             if not self.is_connected:
                 raise ConnectionClosedError(reason=NOT_CONNECTED_MSG)
 
             # Send request
-            self._send_message(request.to_bytes())
+            self._send_message(payload)
 
             # Receive response
             response_data = self._receive_message()
             response = Response.from_bytes(response_data)
 
             # Validate response ID matches request
-            if response.id != request.id:
+            if response.id != request_id:
                 raise ProtocolError(
-                    f"Response ID mismatch: expected {request.id}, got {response.id}"
+                    f"Response ID mismatch: expected {request_id}, got {response.id}"
                 )
 
             logger.debug(
@@ -344,8 +450,9 @@ class BlenderClient:
         logger.debug("Sending ping")
         start_time = time.perf_counter()
 
-        request = create_ping_request()
-        response = self.send_request(request)
+        # Pings have a fixed shape, so skip building a Request
+        request_id = self._next_request_id()
+        response = self._exchange(create_ping_request_bytes(request_id), request_id)
 
         elapsed = time.perf_counter() - start_time
 
@@ -381,7 +488,9 @@ class BlenderClient:
             extra={"code_length": len(code), "timeout_ms": timeout_ms},
         )
 
-        request = create_execute_request(code, timeout_ms)
+        request = create_execute_request(
+            code, timeout_ms, request_id=self._next_request_id()
+        )
         response = self.send_request(request)
 
         if response.is_error:
@@ -424,7 +533,7 @@ class BlenderClient:
         """
         logger.debug("Querying scene", extra={"query": query})
 
-        request = create_query_request(query)
+        request = create_query_request(query, request_id=self._next_request_id())
         response = self.send_request(request)
 
         if response.is_error:
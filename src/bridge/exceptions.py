@@ -103,7 +103,7 @@ class ProtocolError(BridgeError):
     def __init__(
         self,
         reason: str,
-        raw_data: str | bytes | None = None,
+        raw_data: str | bytes | bytearray | None = None,
         context: dict[str, Any] | None = None,
     ) -> None:
         """
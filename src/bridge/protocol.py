@@ -9,15 +9,30 @@ Protocol follows JSON-RPC 2.0 specification with custom extensions.
 
 from __future__ import annotations
 
+import contextlib
 import json
+import math
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from src.bridge.exceptions import ProtocolError
 from src.telemetry.logger import get_logger
 
+# orjson is a declared dependency; the stdlib json module is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+    _ORJSON_OPTIONS = 0
+
 logger = get_logger(__name__)
 
 # Protocol constants
@@ -26,6 +41,101 @@ DEFAULT_TIMEOUT_MS = 5000
 MAX_MESSAGE_SIZE = 10 * 1024 * 1024  # 10 MB
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode read-only mappings (such as a shared empty extra) as objects."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _without_non_finite(obj: Any) -> Any:
+    """Return a copy of obj with NaN and Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, Mapping):
+        return {key: _without_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_without_non_finite(item) for item in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """
+    Serialize with json.dumps, writing non-finite floats as null like orjson.
+
+    The strict encode succeeds for almost every message, so the copy that
+    replaces NaN and Infinity is only built when one is actually present.
+    """
+    try:
+        text = json.dumps(obj, default=_json_default, allow_nan=False)
+    except ValueError:
+        text = json.dumps(
+            _without_non_finite(obj), default=_json_default, allow_nan=False
+        )
+    return text.encode("utf-8")
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON with orjson.
+
+    Falls back to the stdlib encoder when orjson is missing or rejects a
+    value, such as an integer wider than 64 bits. Output is strict JSON on
+    both paths: non-finite floats (NaN, Infinity) are written as null. With
+    orjson, datetime, UUID and dataclass values also serialize instead of
+    raising TypeError.
+    """
+    if not ORJSON_AVAILABLE:
+        return _stdlib_dumps(obj)
+    try:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps(obj)
+
+
+def _loads(raw: str | bytes | bytearray) -> Any:
+    """
+    Parse JSON from text or UTF-8 bytes with orjson.
+
+    Falls back to the stdlib decoder for input orjson rejects but json.loads
+    accepts (NaN/Infinity literals, integers wider than 64 bits), so peers
+    encoding with the stdlib keep working. Invalid JSON raises
+    json.JSONDecodeError either way.
+    """
+    if not ORJSON_AVAILABLE:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+def _schema_error(data: dict[str, Any], required: tuple[str, ...]) -> ProtocolError:
+    """
+    Describe why a message did not match its schema.
+
+    Only called once matching has failed, so the happy path never pays for
+    the individual checks or message formatting.
+
+    Args:
+        data: The rejected message.
+        required: Required fields besides jsonrpc, in reporting order.
+
+    Returns:
+        ProtocolError naming the first problem found.
+    """
+    jsonrpc = data.get("jsonrpc")
+    if jsonrpc != JSONRPC_VERSION:
+        return ProtocolError(f"Invalid jsonrpc version: {jsonrpc}", raw_data=str(data))
+    missing = next(name for name in required if name not in data)
+    return ProtocolError(f"Missing required field: {missing}", raw_data=str(data))
+
+
+def new_request_id() -> str:
+    """Generate a globally unique request id (32 hex chars, no dashes)."""
+    return uuid.uuid4().hex
+
+
 class MessageMethod(str, Enum):
     """Available RPC methods."""
 
@@ -43,24 +153,47 @@ class ResponseStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Result fields written only when set; from_dict restores their defaults
+_OPTIONAL_RESULT_FIELDS = ("data", "logs", "error", "traceback")
+
+# Wire value -> enum member, so parsing skips the Enum constructor
+_METHOD_BY_VALUE: dict[str, MessageMethod] = {m.value: m for m in MessageMethod}
+_STATUS_BY_VALUE: dict[str, ResponseStatus] = {s.value: s for s in ResponseStatus}
+
+
+@dataclass(frozen=True, slots=True)
 class RequestParams:
-    """Parameters for an RPC request."""
+    """
+    Parameters for an RPC request.
+
+    Frozen so that params-less requests can share _EMPTY_PARAMS.
+    """
 
     code: str | None = None
     timeout: int = DEFAULT_TIMEOUT_MS
     query: str | None = None
-    extra: dict[str, Any] = field(default_factory=dict)
+    extra: Mapping[str, Any] = field(default_factory=dict)
+
 
+# Shared by every request built or parsed without params; its extra mapping is
+# read-only so no caller can change the params of every other such request
+_EMPTY_PARAMS = RequestParams(extra=MappingProxyType({}))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Request:
-    """JSON-RPC request message."""
+    """
+    JSON-RPC request message.
+
+    Messages are immutable once built, so the encoded bytes are cached on
+    first serialization and reused by later to_bytes()/to_json() calls.
+    """
 
     method: MessageMethod
-    params: RequestParams = field(default_factory=RequestParams)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    params: RequestParams = _EMPTY_PARAMS
+    id: str = field(default_factory=new_request_id)
     jsonrpc: str = JSONRPC_VERSION
+    _encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert request to dictionary for JSON serialization."""
@@ -71,17 +204,34 @@ class Request:
             "method": (
                 self.method.value if isinstance(self.method, Enum) else self.method
             ),
-            "params": asdict(self.params),
+            "params": {
+                "code": self.params.code,
+                "timeout": self.params.timeout,
+                "query": self.params.query,
+                "extra": dict(self.params.extra),
+            },
         }
 
     def to_json(self) -> str:
         """Serialize request to JSON string."""
-        logger.debug("Serializing request to JSON", extra={"id": self.id})
-        return json.dumps(self.to_dict())
+        return self.to_bytes().decode("utf-8")
 
     def to_bytes(self) -> bytes:
         """Serialize request to bytes with UTF-8 encoding."""
-        return self.to_json().encode("utf-8")
+        encoded = self._encoded
+        if encoded is None:
+            logger.debug("Serializing request to JSON", extra={"id": self.id})
+            if ORJSON_AVAILABLE:
+                # orjson walks the dataclass natively (skipping the private
+                # cache field), so no intermediate dict is built
+                with contextlib.suppress(orjson.JSONEncodeError):
+                    encoded = orjson.dumps(
+                        self, default=_json_default, option=_ORJSON_OPTIONS
+                    )
+            if encoded is None:
+                encoded = _dumps(self.to_dict())
+            object.__setattr__(self, "_encoded", encoded)
+        return encoded
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Request:
@@ -101,51 +251,50 @@ class Request:
             "Parsing request from dict", extra={"data_keys": list(data.keys())}
         )
 
-        # Validate required fields
-        if data.get("jsonrpc") != JSONRPC_VERSION:
-            raise ProtocolError(
-                f"Invalid jsonrpc version: {data.get('jsonrpc')}",
-                raw_data=str(data),
-            )
-
-        if "method" not in data:
-            raise ProtocolError("Missing required field: method", raw_data=str(data))
-
-        if "id" not in data:
-            raise ProtocolError("Missing required field: id", raw_data=str(data))
+        # Destructure required fields in one pass; diagnose only on mismatch
+        match data:
+            case {"jsonrpc": jsonrpc, "method": method_value, "id": request_id} if (
+                jsonrpc == JSONRPC_VERSION
+            ):
+                pass
+            case _:
+                raise _schema_error(data, required=("method", "id"))
 
         # Parse method
         try:
-            method = MessageMethod(data["method"])
-        except ValueError as err:
+            method = _METHOD_BY_VALUE[method_value]
+        except (KeyError, TypeError) as err:
             raise ProtocolError(
-                f"Unknown method: {data['method']}",
+                f"Unknown method: {method_value}",
                 raw_data=str(data),
             ) from err
 
         # Parse params
-        params_data = data.get("params", {})
-        params = RequestParams(
-            code=params_data.get("code"),
-            timeout=params_data.get("timeout", DEFAULT_TIMEOUT_MS),
-            query=params_data.get("query"),
-            extra=params_data.get("extra", {}),
-        )
+        params_data = data.get("params")
+        if params_data:
+            params = RequestParams(
+                code=params_data.get("code"),
+                timeout=params_data.get("timeout", DEFAULT_TIMEOUT_MS),
+                query=params_data.get("query"),
+                extra=params_data.get("extra", {}),
+            )
+        else:
+            params = _EMPTY_PARAMS
 
         return cls(
-            jsonrpc=data["jsonrpc"],
-            id=data["id"],
+            jsonrpc=jsonrpc,
+            id=request_id,
             method=method,
             params=params,
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> Request:
+    def from_json(cls, json_str: str | bytes | bytearray) -> Request:
         """
         Parse Request from JSON string.
 
         Args:
-            json_str: JSON string to parse.
+            json_str: JSON string (or UTF-8 encoded bytes) to parse.
 
         Returns:
             Request instance.
@@ -155,21 +304,26 @@ class Request:
         """
         logger.debug("Parsing request from JSON")
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as err:
+            data = _loads(json_str)
+        except (json.JSONDecodeError, UnicodeDecodeError) as err:
             raise ProtocolError(f"Invalid JSON: {err}", raw_data=json_str) from err
 
         return cls.from_dict(data)
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Request:
-        """Parse Request from bytes."""
-        return cls.from_json(data.decode("utf-8"))
+    def from_bytes(cls, data: bytes | bytearray) -> Request:
+        """Parse Request from UTF-8 bytes without decoding them to str first."""
+        return cls.from_json(data)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResponseResult:
-    """Result payload for an RPC response."""
+    """
+    Result payload for an RPC response.
+
+    Frozen because Response caches its encoded bytes; a result changed after
+    encoding would otherwise go out on the wire with stale content.
+    """
 
     status: ResponseStatus
     data: dict[str, Any] = field(default_factory=dict)
@@ -178,30 +332,34 @@ class ResponseResult:
     traceback: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Response:
-    """JSON-RPC response message."""
+    """
+    JSON-RPC response message.
+
+    Messages are immutable once built, so the encoded bytes are cached on
+    first serialization and reused by later to_bytes()/to_json() calls.
+    """
 
     id: str
     result: ResponseResult
     jsonrpc: str = JSONRPC_VERSION
+    _encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert response to dictionary for JSON serialization."""
         logger.debug("Converting response to dict", extra={"id": self.id})
-        result_dict = {
+        result_dict: dict[str, Any] = {
             "status": (
                 self.result.status.value
                 if isinstance(self.result.status, Enum)
                 else self.result.status
             ),
-            "data": self.result.data,
-            "logs": self.result.logs,
         }
-        if self.result.error:
-            result_dict["error"] = self.result.error
-        if self.result.traceback:
-            result_dict["traceback"] = self.result.traceback
+        for name in _OPTIONAL_RESULT_FIELDS:
+            value = getattr(self.result, name)
+            if value:
+                result_dict[name] = value
 
         return {
             "jsonrpc": self.jsonrpc,
@@ -211,12 +369,16 @@ class Response:
 
     def to_json(self) -> str:
         """Serialize response to JSON string."""
-        logger.debug("Serializing response to JSON", extra={"id": self.id})
-        return json.dumps(self.to_dict())
+        return self.to_bytes().decode("utf-8")
 
     def to_bytes(self) -> bytes:
         """Serialize response to bytes with UTF-8 encoding."""
-        return self.to_json().encode("utf-8")
+        encoded = self._encoded
+        if encoded is None:
+            logger.debug("Serializing response to JSON", extra={"id": self.id})
+            encoded = _dumps(self.to_dict())
+            object.__setattr__(self, "_encoded", encoded)
+        return encoded
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Response:
@@ -236,50 +398,47 @@ class Response:
             "Parsing response from dict", extra={"data_keys": list(data.keys())}
         )
 
-        # Validate required fields
-        if data.get("jsonrpc") != JSONRPC_VERSION:
-            raise ProtocolError(
-                f"Invalid jsonrpc version: {data.get('jsonrpc')}",
-                raw_data=str(data),
-            )
-
-        if "id" not in data:
-            raise ProtocolError("Missing required field: id", raw_data=str(data))
-
-        if "result" not in data:
-            raise ProtocolError("Missing required field: result", raw_data=str(data))
+        # Destructure required fields in one pass; diagnose only on mismatch
+        match data:
+            case {"jsonrpc": jsonrpc, "id": response_id, "result": result_data} if (
+                jsonrpc == JSONRPC_VERSION
+            ):
+                pass
+            case _:
+                raise _schema_error(data, required=("id", "result"))
 
         # Parse result
-        result_data = data["result"]
+        status_value = result_data.get("status", "error")
         try:
-            status = ResponseStatus(result_data.get("status", "error"))
-        except ValueError as err:
+            status = _STATUS_BY_VALUE[status_value]
+        except (KeyError, TypeError) as err:
             raise ProtocolError(
-                f"Invalid status: {result_data.get('status')}",
+                f"Invalid status: {status_value}",
                 raw_data=str(data),
             ) from err
 
+        # Null and omitted optional fields read back as the same defaults
         result = ResponseResult(
             status=status,
-            data=result_data.get("data", {}),
-            logs=result_data.get("logs", ""),
+            data=result_data.get("data") or {},
+            logs=result_data.get("logs") or "",
             error=result_data.get("error"),
             traceback=result_data.get("traceback"),
         )
 
         return cls(
-            jsonrpc=data["jsonrpc"],
-            id=data["id"],
+            jsonrpc=jsonrpc,
+            id=response_id,
             result=result,
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> Response:
+    def from_json(cls, json_str: str | bytes | bytearray) -> Response:
         """
         Parse Response from JSON string.
 
         Args:
-            json_str: JSON string to parse.
+            json_str: JSON string (or UTF-8 encoded bytes) to parse.
 
         Returns:
             Response instance.
@@ -289,16 +448,16 @@ class Response:
         """
         logger.debug("Parsing response from JSON")
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as err:
+            data = _loads(json_str)
+        except (json.JSONDecodeError, UnicodeDecodeError) as err:
             raise ProtocolError(f"Invalid JSON: {err}", raw_data=json_str) from err
 
         return cls.from_dict(data)
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Response:
-        """Parse Response from bytes."""
-        return cls.from_json(data.decode("utf-8"))
+    def from_bytes(cls, data: bytes | bytearray) -> Response:
+        """Parse Response from UTF-8 bytes without decoding them to str first."""
+        return cls.from_json(data)
 
     @property
     def is_success(self) -> bool:
@@ -311,19 +470,60 @@ class Response:
         return self.result.status == ResponseStatus.ERROR
 
 
-def create_ping_request() -> Request:
-    """Create a ping request for connection health check."""
+def create_ping_request(request_id: str | None = None) -> Request:
+    """
+    Create a ping request for connection health check.
+
+    Args:
+        request_id: Request id to use; a UUID is generated when omitted.
+
+    Returns:
+        Request for a ping.
+    """
     logger.debug("Creating ping request")
-    return Request(method=MessageMethod.PING)
+    return Request(method=MessageMethod.PING, id=request_id or new_request_id())
+
+
+# Wire form of a ping request; only the id differs between pings
+_PING_TEMPLATE = (
+    b'{"jsonrpc":"%b","id":%b,"method":"ping",'
+    b'"params":{"code":null,"timeout":%d,"query":null,"extra":{}}}'
+)
+
+
+def create_ping_request_bytes(request_id: str | None = None) -> bytes:
+    """
+    Create a serialized ping request without building a Request.
+
+    The output is JSON equivalent to create_ping_request(request_id).to_bytes(),
+    with the same members and values, but the key order may differ, so the
+    bytes are not guaranteed to be identical.
+
+    Args:
+        request_id: Request id to use; a UUID is generated when omitted.
+
+    Returns:
+        UTF-8 encoded ping request.
+    """
+    return _PING_TEMPLATE % (
+        JSONRPC_VERSION.encode("utf-8"),
+        _dumps(request_id or new_request_id()),
+        DEFAULT_TIMEOUT_MS,
+    )
 
 
-def create_execute_request(code: str, timeout_ms: int = DEFAULT_TIMEOUT_MS) -> Request:
+def create_execute_request(
+    code: str,
+    timeout_ms: int = DEFAULT_TIMEOUT_MS,
+    request_id: str | None = None,
+) -> Request:
     """
     Create a code execution request.
 
     Args:
         code: Python code to execute in Blender.
         timeout_ms: Timeout in milliseconds.
+        request_id: Request id to use; a UUID is generated when omitted.
 
     Returns:
         Request for code execution.
@@ -335,15 +535,17 @@ def create_execute_request(code: str, timeout_ms: int = DEFAULT_TIMEOUT_MS) -> R
     return Request(
         method=MessageMethod.EXECUTE_CODE,
         params=RequestParams(code=code, timeout=timeout_ms),
+        id=request_id or new_request_id(),
     )
 
 
-def create_query_request(query: str) -> Request:
+def create_query_request(query: str, request_id: str | None = None) -> Request:
     """
     Create a scene query request.
 
     Args:
         query: Query string for scene information.
+        request_id: Request id to use; a UUID is generated when omitted.
 
     Returns:
         Request for scene query.
@@ -352,6 +554,7 @@ def create_query_request(query: str) -> Request:
     return Request(
         method=MessageMethod.QUERY_SCENE,
         params=RequestParams(query=query),
+        id=request_id or new_request_id(),
     )
 
 
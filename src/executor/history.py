@@ -4,6 +4,8 @@ Executor Module - Execution History.
 Tracks execution history for debugging, analytics, and context.
 """
 
+import itertools
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -24,6 +26,10 @@ class ExecutionStatus(Enum):
     SKIPPED = "skipped"  # Validation failed
 
 
+# Statuses counted as a successful execution
+SUCCESS_STATUSES = frozenset({ExecutionStatus.SUCCESS, ExecutionStatus.FIXED})
+
+
 @dataclass
 class ExecutionRecord:
     """Record of a single execution attempt."""
@@ -59,9 +65,12 @@ class ExecutionHistory:
         Args:
             max_records: Maximum records to keep in memory.
         """
-        self._records: list[ExecutionRecord] = []
+        # Bounded ring buffer: appending past max_records drops the oldest
+        self._records: deque[ExecutionRecord] = deque(maxlen=max_records)
         self._max_records = max_records
         self._record_counter = 0
+        # Successes among the retained records, so success_rate is O(1)
+        self._success_count = 0
         logger.debug(
             "ExecutionHistory initialized",
             extra={"max_records": max_records},
@@ -124,15 +133,17 @@ class ExecutionHistory:
             context=context or {},
         )
 
-        self._records.append(record)
-
-        # Trim if over limit
-        if len(self._records) > self._max_records:
-            removed = self._records.pop(0)
+        if self._records and len(self._records) == self._max_records:
+            evicted = self._records[0]
+            if evicted.status in SUCCESS_STATUSES:
+                self._success_count -= 1
             logger.debug(
                 "Removed old record to maintain limit",
-                extra={"removed_id": removed.id},
+                extra={"removed_id": evicted.id},
             )
+        if self._max_records > 0 and record.status in SUCCESS_STATUSES:
+            self._success_count += 1
+        self._records.append(record)
 
         logger.debug(
             "Execution record added",
@@ -155,7 +166,7 @@ class ExecutionHistory:
         Returns:
             List of recent records (newest first).
         """
-        return list(reversed(self._records[-count:]))
+        return list(itertools.islice(reversed(self._records), max(count, 0)))
 
     def get_failures(self, count: int = 5) -> list[ExecutionRecord]:
         """
@@ -169,12 +180,12 @@ class ExecutionHistory:
         Returns:
             List of failed records (newest first).
         """
-        failures = [
+        failures = (
             r
             for r in reversed(self._records)
             if r.status in (ExecutionStatus.FAILED, ExecutionStatus.TIMEOUT)
-        ]
-        return failures[:count]
+        )
+        return list(itertools.islice(failures, max(count, 0)))
 
     def get_successes(self, count: int = 5) -> list[ExecutionRecord]:
         """
@@ -188,12 +199,8 @@ class ExecutionHistory:
         Returns:
             List of successful records (newest first).
         """
-        successes = [
-            r
-            for r in reversed(self._records)
-            if r.status in (ExecutionStatus.SUCCESS, ExecutionStatus.FIXED)
-        ]
-        return successes[:count]
+        successes = (r for r in reversed(self._records) if r.status in SUCCESS_STATUSES)
+        return list(itertools.islice(successes, max(count, 0)))
 
     def get_context_for_ai(self, max_examples: int = 3) -> dict[str, Any]:
         """
@@ -226,6 +233,7 @@ class ExecutionHistory:
         """Clear all execution records."""
         count = len(self._records)
         self._records.clear()
+        self._success_count = 0
         logger.info("Execution history cleared", extra={"records_removed": count})
 
     @property
@@ -238,9 +246,4 @@ class ExecutionHistory:
         """Calculate success rate of executions."""
         if not self._records:
             return 0.0
-        successes = sum(
-            1
-            for r in self._records
-            if r.status in (ExecutionStatus.SUCCESS, ExecutionStatus.FIXED)
-        )
-        return successes / len(self._records)
+        return self._success_count / len(self._records)
@@ -5,8 +5,9 @@ Exponential backoff retry mechanism for failed code execution.
 """
 
 import asyncio
+import random
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, TypeVar
 
 from src.executor.exceptions import RetryExhaustedError
@@ -20,15 +21,39 @@ T = TypeVar("T")
 UNKNOWN_ERROR = "Unknown error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """
+    Configuration for retry behavior.
+
+    Frozen so the backoff delays can be computed once, when it is created.
+    Only the waits between attempts are precomputed; none follows the last.
+    """
 
     max_attempts: int = 3
     initial_delay: float = 0.5
     max_delay: float = 10.0
     exponential_base: float = 2.0
     jitter: bool = True
+    _delay_table: tuple[float, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute the capped backoff delay after each non-final attempt."""
+        table = tuple(
+            self._base_delay(attempt) for attempt in range(1, self.max_attempts)
+        )
+        object.__setattr__(self, "_delay_table", table)
+
+    def _base_delay(self, attempt: int) -> float:
+        """Return the capped exponential delay for an attempt, without jitter."""
+        try:
+            delay = self.initial_delay * (self.exponential_base ** (attempt - 1))
+        except OverflowError:
+            # The uncapped delay is past float range, so the cap applies
+            return self.max_delay
+        return min(delay, self.max_delay)
 
     def get_delay(self, attempt: int) -> float:
         """
@@ -40,10 +65,10 @@ class RetryConfig:
         Returns:
             Delay in seconds.
         """
-        import random
-
-        delay = self.initial_delay * (self.exponential_base ** (attempt - 1))
-        delay = min(delay, self.max_delay)
+        if 1 <= attempt <= len(self._delay_table):
+            delay = self._delay_table[attempt - 1]
+        else:
+            delay = self._base_delay(attempt)
 
         if self.jitter:
             # Add up to 25% random jitter
@@ -144,8 +169,9 @@ class RetryManager:
             if attempt < self._config.max_attempts and fix_fn is not None:
                 try:
                     delay = self._config.get_delay(attempt)
-                    logger.debug(f"Waiting {delay:.2f}s before retry")
-                    await asyncio.sleep(delay)
+                    if delay > 0:
+                        logger.debug(f"Waiting {delay:.2f}s before retry")
+                        await asyncio.sleep(delay)
 
                     logger.debug("Attempting to fix code")
                     current_code = await fix_fn(current_code, error_msg)
@@ -162,8 +188,9 @@ class RetryManager:
             elif attempt < self._config.max_attempts:
                 # No fix function, just wait and retry same code
                 delay = self._config.get_delay(attempt)
-                logger.debug(f"Waiting {delay:.2f}s before retry (no fix)")
-                await asyncio.sleep(delay)
+                if delay > 0:
+                    logger.debug(f"Waiting {delay:.2f}s before retry (no fix)")
+                    await asyncio.sleep(delay)
 
         # All attempts exhausted
         logger.error(
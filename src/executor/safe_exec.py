@@ -6,6 +6,7 @@ This module prepares code for execution via the Bridge client.
 """
 
 import ast
+import functools
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -26,6 +27,32 @@ LOGGED_PATTERNS = [
     (r"\bexec\s*\(", "exec call"),
 ]
 
+# Compiled once at import so detect_patterns does no per-call pattern lookup
+_COMPILED_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern), description) for pattern, description in LOGGED_PATTERNS
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _check_syntax(code: str) -> tuple[bool, str | None, int | None]:
+    """
+    Parse code to an AST and report any syntax error.
+
+    Results are cached by source text, since retries and history replays
+    validate the same snippets repeatedly.
+
+    Args:
+        code: The Python code to parse.
+
+    Returns:
+        Tuple of (is_valid, error_message, error_line).
+    """
+    try:
+        compile(code, "<validate>", "exec", ast.PyCF_ONLY_AST)
+    except SyntaxError as e:
+        return False, f"{e.msg} at line {e.lineno}", e.lineno
+    return True, None, None
+
 
 @dataclass
 class ExecutionResult:
@@ -75,17 +102,15 @@ class SafeExecutor:
         """
         logger.debug("Validating syntax", extra={"code_length": len(code)})
 
-        try:
-            ast.parse(code)
+        is_valid, error_msg, error_line = _check_syntax(code)
+        if is_valid:
             logger.debug("Syntax validation passed")
-            return True, None, None
-        except SyntaxError as e:
-            error_msg = f"{e.msg} at line {e.lineno}"
+        else:
             logger.warning(
                 "Syntax validation failed",
-                extra={"error": error_msg, "line": e.lineno},
+                extra={"error": error_msg, "line": error_line},
             )
-            return False, error_msg, e.lineno
+        return is_valid, error_msg, error_line
 
     def detect_patterns(self, code: str) -> list[str]:
         """
@@ -97,10 +122,11 @@ class SafeExecutor:
         Returns:
             List of detected pattern descriptions.
         """
-        detected = []
-        for pattern, description in LOGGED_PATTERNS:
-            if re.search(pattern, code):
-                detected.append(description)
+        detected = [
+            description
+            for pattern, description in _COMPILED_PATTERNS
+            if pattern.search(code)
+        ]
 
         if detected and self._log_patterns:
             logger.info(
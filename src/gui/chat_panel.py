@@ -5,6 +5,7 @@ Chat interface with message history display and input area.
 Connects to signals for sending/receiving messages.
 """
 
+from collections.abc import Iterable
 from datetime import datetime
 
 from PyQt6.QtCore import Qt, QTimer
@@ -230,17 +231,30 @@ class MessageList(QScrollArea):
 
     def _add_message(self, message: ChatMessage) -> None:
         """Add a message to the list."""
-        self._messages.append(message)
+        self.add_messages([message])
 
+    def add_messages(self, messages: Iterable[ChatMessage]) -> None:
+        """
+        Add several messages to the list in one pass.
+
+        The trailing stretch is moved and the scroll to the bottom scheduled
+        once for the whole batch rather than once per message.
+
+        Args:
+            messages: Messages to append, in display order
+        """
         # Remove the stretch at the end
         stretch_item = self._layout.takeAt(self._layout.count() - 1)
         if stretch_item:
             del stretch_item
 
-        # Add message widget
-        msg_container = MessageContainer(message, self._container)
-        msg_container.code_copy_requested.connect(self._copy_to_clipboard)
-        self._layout.addWidget(msg_container)
+        for message in messages:
+            self._messages.append(message)
+
+            # Add message widget
+            msg_container = MessageContainer(message, self._container)
+            msg_container.code_copy_requested.connect(self._copy_to_clipboard)
+            self._layout.addWidget(msg_container)
 
         # Add stretch back
         self._layout.addStretch()
@@ -406,6 +420,15 @@ class ChatPanel(QFrame):
         self._signals.chat_cleared.emit()
         self._add_welcome_message()
 
+    def append_messages(self, messages: Iterable[ChatMessage]) -> None:
+        """
+        Append several messages to the display without emitting signals.
+
+        Args:
+            messages: Messages to append, in display order
+        """
+        self._message_list.add_messages(messages)
+
     def set_focus(self) -> None:
         """Set focus to the input field."""
         self._input.set_focus()
@@ -241,6 +241,20 @@ class MainWindow(QMainWindow):
         logger.error("Error received in MainWindow", extra={"error": error})
         self._signals.show_error(error)
 
+    # ========================================================================
+    # Properties
+    # ========================================================================
+
+    @property
+    def chat_panel(self) -> ChatPanel:
+        """Return the chat panel."""
+        return self._chat_panel
+
+    @property
+    def status_bar(self) -> AetherStatusBar:
+        """Return the Aether status bar."""
+        return self._status_bar
+
     # ========================================================================
     # Overrides
     # ========================================================================
@@ -25,6 +25,36 @@ from src.telemetry.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Built once at import; every bubble of a role shares the same stylesheet text
+_ROLE_STYLESHEETS: dict[MessageRole, str] = {
+    MessageRole.USER: f"""
+        QFrame#userBubble {{
+            background-color: {COLORS.user_bubble};
+            border-radius: {DIMS.radius_lg}px;
+        }}
+    """,
+    MessageRole.ASSISTANT: f"""
+        QFrame#assistantBubble {{
+            background-color: {COLORS.assistant_bubble};
+            border: 1px solid {COLORS.border_medium};
+            border-radius: {DIMS.radius_lg}px;
+        }}
+    """,
+    MessageRole.SYSTEM: f"""
+        QFrame#systemMessage {{
+            background-color: {COLORS.system_bubble};
+            border-radius: {DIMS.radius_md}px;
+        }}
+    """,
+    MessageRole.ERROR: f"""
+        QFrame#errorMessage {{
+            background-color: {COLORS.error_bubble};
+            border: 1px solid {COLORS.error};
+            border-radius: {DIMS.radius_md}px;
+        }}
+    """,
+}
+
 
 class CodeBlock(QFrame):
     """
@@ -63,17 +93,17 @@ class CodeBlock(QFrame):
         header = QHBoxLayout()
         header.setContentsMargins(8, 4, 8, 4)
 
-        lang_label = QLabel("Python")
-        lang_label.setStyleSheet(
+        self._language_label = QLabel("Python")
+        self._language_label.setStyleSheet(
             f"color: {COLORS.text_muted}; font-size: {FONTS.size_small}px;"
         )
-        header.addWidget(lang_label)
+        header.addWidget(self._language_label)
 
         header.addStretch()
 
-        copy_btn = QPushButton("Copy")
-        copy_btn.setFixedHeight(24)
-        copy_btn.setStyleSheet(
+        self._copy_button = QPushButton("Copy")
+        self._copy_button.setFixedHeight(24)
+        self._copy_button.setStyleSheet(
             f"""
             QPushButton {{
                 background-color: transparent;
@@ -88,8 +118,8 @@ class CodeBlock(QFrame):
             }}
         """
         )
-        copy_btn.clicked.connect(self._on_copy)
-        header.addWidget(copy_btn)
+        self._copy_button.clicked.connect(self._on_copy)
+        header.addWidget(self._copy_button)
 
         layout.addLayout(header)
 
@@ -134,6 +164,16 @@ class CodeBlock(QFrame):
         """Return the code content."""
         return self._code
 
+    @property
+    def copy_button(self) -> QPushButton:
+        """Return the copy button."""
+        return self._copy_button
+
+    @property
+    def language_label(self) -> QLabel:
+        """Return the language label."""
+        return self._language_label
+
 
 class MessageBubble(QFrame):
     """
@@ -188,17 +228,17 @@ class MessageBubble(QFrame):
         layout.setSpacing(DIMS.spacing_sm)
 
         # Content label
-        content_label = QLabel(self._message.content)
-        content_label.setWordWrap(True)
-        content_label.setTextInteractionFlags(
+        self._content_label = QLabel(self._message.content)
+        self._content_label.setWordWrap(True)
+        self._content_label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse
             | Qt.TextInteractionFlag.LinksAccessibleByMouse
         )
-        content_label.setOpenExternalLinks(True)
-        content_label.setSizePolicy(
+        self._content_label.setOpenExternalLinks(True)
+        self._content_label.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
         )
-        layout.addWidget(content_label)
+        layout.addWidget(self._content_label)
 
         # Code block if present
         if self._message.code:
@@ -207,12 +247,12 @@ class MessageBubble(QFrame):
             layout.addWidget(code_block)
 
         # Timestamp
-        timestamp_label = QLabel(self._format_timestamp(self._message.timestamp))
-        timestamp_label.setStyleSheet(
+        self._timestamp_label = QLabel(self._format_timestamp(self._message.timestamp))
+        self._timestamp_label.setStyleSheet(
             f"color: {COLORS.text_muted}; font-size: {FONTS.size_small}px;"
         )
-        timestamp_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        layout.addWidget(timestamp_label)
+        self._timestamp_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.addWidget(self._timestamp_label)
 
         # Apply role-specific styling
         self._apply_role_style(role)
@@ -223,35 +263,9 @@ class MessageBubble(QFrame):
 
     def _apply_role_style(self, role: MessageRole) -> None:
         """Apply styling based on message role."""
-        styles = {
-            MessageRole.USER: f"""
-                QFrame#userBubble {{
-                    background-color: {COLORS.user_bubble};
-                    border-radius: {DIMS.radius_lg}px;
-                }}
-            """,
-            MessageRole.ASSISTANT: f"""
-                QFrame#assistantBubble {{
-                    background-color: {COLORS.assistant_bubble};
-                    border: 1px solid {COLORS.border_medium};
-                    border-radius: {DIMS.radius_lg}px;
-                }}
-            """,
-            MessageRole.SYSTEM: f"""
-                QFrame#systemMessage {{
-                    background-color: {COLORS.system_bubble};
-                    border-radius: {DIMS.radius_md}px;
-                }}
-            """,
-            MessageRole.ERROR: f"""
-                QFrame#errorMessage {{
-                    background-color: {COLORS.error_bubble};
-                    border: 1px solid {COLORS.error};
-                    border-radius: {DIMS.radius_md}px;
-                }}
-            """,
-        }
-        self.setStyleSheet(styles.get(role, styles[MessageRole.ASSISTANT]))
+        self.setStyleSheet(
+            _ROLE_STYLESHEETS.get(role, _ROLE_STYLESHEETS[MessageRole.ASSISTANT])
+        )
 
     @staticmethod
     def _format_timestamp(timestamp: datetime) -> str:
@@ -263,6 +277,16 @@ class MessageBubble(QFrame):
         """Return the chat message."""
         return self._message
 
+    @property
+    def content_label(self) -> QLabel:
+        """Return the label showing the message content."""
+        return self._content_label
+
+    @property
+    def timestamp_label(self) -> QLabel:
+        """Return the label showing the message time."""
+        return self._timestamp_label
+
 
 class MessageContainer(QWidget):
     """
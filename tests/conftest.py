@@ -4,6 +4,7 @@ Pytest Configuration and Shared Fixtures.
 This module contains fixtures available to all tests.
 """
 
+import os
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -13,6 +14,11 @@ import pytest
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Render Qt widgets offscreen so the GUI tests never open native windows or
+# need a display. Read when pytest-qt creates the shared QApplication, so it
+# must be set before any test runs; export QT_QPA_PLATFORM to override.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 
 # ============================================================================
 # Mock bpy for unit tests (bpy is only available inside Blender)
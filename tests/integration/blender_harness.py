@@ -0,0 +1,101 @@
+"""
+Blender Process Harness for Integration Tests.
+
+Shared paths, settings, and helpers used by the integration fixtures in
+``conftest.py`` and by the integration test modules themselves.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from pathlib import Path
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+BLENDER_PATH = PROJECT_ROOT / "tools" / "blender" / "blender.exe"
+ADDON_SRC = PROJECT_ROOT / "src" / "blender_addon"
+BLENDER_ADDONS_DIR = (
+    PROJECT_ROOT / "tools" / "blender" / "4.2" / "scripts" / "addons" / "aether_bridge"
+)
+
+# Bridge settings
+DEFAULT_HOST = "localhost"
+DEFAULT_PORT = 5005
+STARTUP_TIMEOUT = 15  # seconds to wait for Blender to start
+
+# Storage for Blender process output (module-level for fixture access)
+blender_output_lines: queue.Queue[str] = queue.Queue()
+
+
+def drain_stdout(process: subprocess.Popen, output_queue: queue.Queue) -> None:
+    """Read stdout from process and store in queue to prevent buffer blocking."""
+    try:
+        for line in iter(process.stdout.readline, ""):
+            if line:
+                output_queue.put(line.rstrip())
+            else:
+                break
+    except (ValueError, OSError):
+        # Process closed
+        pass
+
+
+def is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Check if a port is open (server is listening)."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            result = sock.connect_ex((host, port))
+            return result == 0
+    except OSError:
+        return False
+
+
+def discard_addon_dir() -> None:
+    """
+    Remove the installed addon without blocking on a recursive delete.
+
+    Symlinks are unlinked directly. Copied directories are renamed to a
+    sibling ``.trash-*`` directory (atomic on the same filesystem) and
+    deleted on a daemon thread so teardown returns immediately.
+    """
+    if BLENDER_ADDONS_DIR.is_symlink():
+        BLENDER_ADDONS_DIR.unlink()
+    elif BLENDER_ADDONS_DIR.exists():
+        trash = BLENDER_ADDONS_DIR.with_suffix(f".trash-{uuid.uuid4().hex[:8]}")
+        os.rename(BLENDER_ADDONS_DIR, trash)
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash,),
+            kwargs={"ignore_errors": True},
+            daemon=True,
+        ).start()
+
+
+def sweep_addon_trash() -> None:
+    """Delete any ``.trash-*`` addon directories left by earlier runs."""
+    if not BLENDER_ADDONS_DIR.parent.exists():
+        return
+    for trash in BLENDER_ADDONS_DIR.parent.glob(f"{BLENDER_ADDONS_DIR.name}.trash-*"):
+        shutil.rmtree(trash, ignore_errors=True)
+
+
+def wait_for_port(
+    host: str,
+    port: int,
+    timeout: float = STARTUP_TIMEOUT,
+) -> bool:
+    """Wait for a port to become available."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if is_port_open(host, port):
+            return True
+        time.sleep(0.5)
+    return False
@@ -0,0 +1,248 @@
+"""
+Integration Test Fixtures.
+
+Blender is expensive to launch, so a single background Blender process with
+the addon enabled is shared by every integration test in the session. Test
+classes isolate themselves by resetting the scene when their client fixture
+is torn down.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import queue
+import shutil
+import subprocess
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from tests.integration.blender_harness import (
+    ADDON_SRC,
+    BLENDER_ADDONS_DIR,
+    BLENDER_PATH,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    PROJECT_ROOT,
+    STARTUP_TIMEOUT,
+    blender_output_lines,
+    discard_addon_dir,
+    drain_stdout,
+    sweep_addon_trash,
+    wait_for_port,
+)
+
+RESET_SCENE_CODE = "import bpy; bpy.ops.wm.read_homefile(use_empty=True)"
+INTEGRATION_DIR = Path(__file__).parent
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Pin every integration test to a single xdist worker.
+
+    Each xdist worker runs its own session, so without a shared group every
+    worker would launch its own Blender on DEFAULT_PORT and race over the
+    addon directory. With --dist=loadgroup the "blender" group runs on one
+    worker while unit tests are spread across the rest. Runs first so the
+    marker is in place before xdist reads the groups.
+    """
+    for item in items:
+        if INTEGRATION_DIR in item.path.parents:
+            item.add_marker(pytest.mark.xdist_group("blender"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _addon_trash_sweeper() -> Generator[None, None, None]:
+    """Sweep leftover addon trash directories once the session finishes."""
+    yield
+    sweep_addon_trash()
+
+
+@pytest.fixture(scope="session")
+def install_addon() -> Generator[Path, None, None]:
+    """
+    Install the addon to Blender's addons directory.
+
+    This fixture copies the addon source to Blender's scripts/addons folder
+    and cleans up after the test session completes.
+    """
+    if not BLENDER_PATH.exists():
+        pytest.skip("Blender not installed")
+
+    # Ensure target directory exists
+    BLENDER_ADDONS_DIR.parent.mkdir(parents=True, exist_ok=True)
+
+    # Remove existing addon installation (handle both symlink and directory)
+    discard_addon_dir()
+
+    # Create symlink to addon source (more efficient than copying)
+    try:
+        BLENDER_ADDONS_DIR.symlink_to(ADDON_SRC, target_is_directory=True)
+    except OSError:
+        # Fallback to copy if symlink fails (e.g., no admin rights)
+        shutil.copytree(ADDON_SRC, BLENDER_ADDONS_DIR)
+
+    yield BLENDER_ADDONS_DIR
+
+    # Cleanup (handle both symlink and directory)
+    discard_addon_dir()
+
+
+@pytest.fixture(scope="session")
+def blender_with_addon(
+    install_addon: Path,
+) -> Generator[subprocess.Popen, None, None]:
+    """
+    Start Blender in background mode with the addon enabled.
+
+    This fixture launches Blender with a startup script that enables
+    the addon and keeps Blender running until the session finishes.
+    """
+    # Create startup script that directly imports and registers the addon
+    # We add the addons directory to sys.path and import directly
+    # rather than using addon_enable which has path resolution issues
+    #
+    # IMPORTANT: In background mode, bpy.app.timers don't automatically run.
+    # We need to manually pump the queue by calling the timer callback directly
+    # in our main loop.
+    startup_script = f"""
+import bpy
+import sys
+import time
+
+# Add the addons directory to Python path
+addon_parent = r'{BLENDER_ADDONS_DIR.parent}'
+if addon_parent not in sys.path:
+    sys.path.insert(0, addon_parent)
+
+# Import and register the addon directly
+try:
+    import aether_bridge
+    aether_bridge.register()
+    print("AETHER_BRIDGE: Addon registered successfully", flush=True)
+except Exception as e:
+    import traceback
+    traceback.print_exc()
+    print(f"AETHER_BRIDGE: Failed to register addon: {{e}}", flush=True)
+    sys.exit(1)
+
+print("AETHER_BRIDGE: Server starting, waiting for connections...", flush=True)
+
+# Get reference to the queue handler for manual processing
+# Since we're in background mode, bpy.app.timers don't automatically fire
+_queue_handler = aether_bridge._queue_handler
+
+# Main loop that manually processes the queue. The process is shared by the
+# whole test session, so run until the fixture terminates it.
+i = 0
+while True:
+    i += 1
+    # Manually call the queue handler's timer callback
+    # This processes any pending messages in the queue
+    if _queue_handler is not None:
+        try:
+            result = _queue_handler._timer_callback()
+        except Exception as e:
+            print(f"AETHER_BRIDGE: Timer error: {{e}}", flush=True)
+
+    time.sleep(0.01)  # 10ms instead of 100ms for faster response
+
+    if i % 1000 == 0:  # Every 10 seconds
+        print(f"AETHER_BRIDGE: Still running... ({{i // 100}}s)", flush=True)
+"""
+
+    startup_file = PROJECT_ROOT / "tests" / "fixtures" / "_test_startup.py"
+    startup_file.parent.mkdir(parents=True, exist_ok=True)
+    startup_file.write_text(startup_script)
+
+    # Clear any previous output
+    while not blender_output_lines.empty():
+        try:
+            blender_output_lines.get_nowait()
+        except queue.Empty:
+            break
+
+    try:
+        # Launch Blender in background with the startup script
+        process = subprocess.Popen(
+            [
+                str(BLENDER_PATH),
+                "--background",
+                "--python",
+                str(startup_file),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+        )
+
+        # Start a thread to drain stdout to prevent buffer blocking
+        drain_thread = threading.Thread(
+            target=drain_stdout,
+            args=(process, blender_output_lines),
+            daemon=True,
+        )
+        drain_thread.start()
+
+        # Wait for the server to start
+        if not wait_for_port(DEFAULT_HOST, DEFAULT_PORT, timeout=STARTUP_TIMEOUT):
+            # Collect output for debugging
+            output_lines = []
+            while not blender_output_lines.empty():
+                try:
+                    output_lines.append(blender_output_lines.get_nowait())
+                except queue.Empty:
+                    break
+
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+            pytest.fail(
+                f"Blender addon server did not start within {STARTUP_TIMEOUT}s.\n"
+                f"Output: {chr(10).join(output_lines)}"
+            )
+
+        yield process
+
+    finally:
+        # Terminate Blender
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+        # Cleanup startup script
+        if startup_file.exists():
+            startup_file.unlink()
+
+
+@pytest.fixture(scope="class")
+def connected_client(
+    blender_with_addon: subprocess.Popen,  # noqa: ARG001 - Ensures Blender running
+) -> Generator:
+    """
+    Provide a connected BlenderClient for the test class.
+
+    This reuses a single connection across all tests in the class
+    to avoid connection churn issues. Because the Blender process is
+    shared by the whole session, the scene is reset to an empty file on
+    teardown so the next class starts from a clean state.
+    """
+    from src.bridge.client import BlenderClient
+    from src.bridge.exceptions import BridgeError
+
+    client = BlenderClient()
+    client.connect()
+    yield client
+    with contextlib.suppress(BridgeError):
+        client.execute(RESET_SCENE_CODE)
+    client.disconnect()
@@ -0,0 +1,162 @@
+"""
+Lightweight Test Doubles for Unit Tests.
+
+MagicMock records every attribute access and call, which dominates the cost
+of tight send/receive loops. These fakes implement only what the code under
+test touches and expose plain attributes and counters for assertions. Where
+the real socket path matters, LoopbackServer stands in for Blender instead.
+"""
+
+from __future__ import annotations
+
+import socket
+import struct
+import threading
+from collections import deque
+from collections.abc import Callable
+
+# Big-endian length prefix used by the bridge framing
+HEADER = struct.Struct(">I")
+
+
+class FakeSocket:
+    """
+    In-memory stand-in for ``socket.socket`` as used by BlenderClient.
+
+    Outgoing frames are recorded in ``sent``. Incoming data is queued with
+    ``feed()``; queued exceptions are raised by the receive call that reaches
+    them, and an empty queue reads as a closed connection. A whole framed
+    message can be fed as one blob; set ``recv_limit`` to hand it out in
+    smaller fragments.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unconnected fake socket with empty buffers."""
+        self.sent: list[bytes] = []
+        self.sent_buffers: list[list[bytes]] = []
+        self.send_limit: int | None = None
+        self.recv_limit: int | None = None
+        self.recv_queue: deque[bytes | BaseException] = deque()
+        self.on_send: Callable[[bytes], None] | None = None
+        self.address: tuple[str, int] | None = None
+        self.timeout: float | None = None
+        self.options: dict[tuple[int, int], int] = {}
+        self.connect_count = 0
+        self.send_count = 0
+        self.recv_count = 0
+        self.close_count = 0
+
+    def setsockopt(self, level: int, option: int, value: int) -> None:
+        """Record a socket option."""
+        self.options[(level, option)] = value
+
+    def settimeout(self, value: float | None) -> None:
+        """Record the socket timeout."""
+        self.timeout = value
+
+    def connect(self, address: tuple[str, int]) -> None:
+        """Record the connection address."""
+        self.connect_count += 1
+        self.address = address
+
+    def sendall(self, data: bytes) -> None:
+        """Record an outgoing frame and invoke the ``on_send`` hook."""
+        self.send_count += 1
+        payload = bytes(data)
+        self.sent.append(payload)
+        if self.on_send is not None:
+            self.on_send(payload)
+
+    def sendmsg(self, buffers: list[bytes]) -> int:
+        """
+        Record a scatter/gather send and pass the bytes on to ``sendall``.
+
+        At most ``send_limit`` bytes are accepted when it is set, mimicking a
+        partial send that the caller must complete.
+        """
+        segments = [bytes(buffer) for buffer in buffers]
+        self.sent_buffers.append(segments)
+        payload = b"".join(segments)
+        if self.send_limit is not None:
+            payload = payload[: self.send_limit]
+        self.sendall(payload)
+        return len(payload)
+
+    def feed(self, *chunks: bytes | BaseException) -> None:
+        """Queue chunks (or exceptions to raise) for subsequent receives."""
+        self.recv_queue.extend(chunks)
+
+    def recv_into(self, buffer: memoryview, nbytes: int = 0, flags: int = 0) -> int:
+        """Copy up to ``recv_limit`` bytes of the next queued chunk into buffer."""
+        self.recv_count += 1
+        if not self.recv_queue:
+            return 0
+        chunk = self.recv_queue.popleft()
+        if isinstance(chunk, BaseException):
+            raise chunk
+        size = min(len(chunk), nbytes or len(buffer), self.recv_limit or len(chunk))
+        buffer[:size] = chunk[:size]
+        if size < len(chunk):
+            self.recv_queue.appendleft(chunk[size:])
+        return size
+
+    def close(self) -> None:
+        """Record that the socket was closed."""
+        self.close_count += 1
+
+
+class LoopbackServer:
+    """
+    Real TCP server on the loopback interface speaking the bridge framing.
+
+    Accepts a single connection and answers each length-prefixed request with
+    ``reply(body)``, so a real BlenderClient exercises its true socket path
+    (socket options, sendmsg, recv_into) end to end. Received request bodies
+    are recorded in ``received``.
+    """
+
+    def __init__(self, reply: Callable[[bytes], bytes] | None = None) -> None:
+        """Start listening on an ephemeral port and serve in a daemon thread."""
+        self.reply = reply
+        self.received: list[bytes] = []
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self._listener.settimeout(5.0)
+        self.host, self.port = self._listener.getsockname()[:2]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        """Answer framed requests until the client disconnects."""
+        try:
+            conn, _ = self._listener.accept()
+        except OSError:
+            return
+        with conn:
+            while True:
+                header = self._recv_exact(conn, HEADER.size)
+                if header is None:
+                    return
+                body = self._recv_exact(conn, HEADER.unpack(header)[0])
+                if body is None:
+                    return
+                self.received.append(body)
+                if self.reply is None:
+                    return
+                response = self.reply(body)
+                conn.sendall(HEADER.pack(len(response)) + response)
+
+    @staticmethod
+    def _recv_exact(conn: socket.socket, size: int) -> bytes | None:
+        """Read exactly ``size`` bytes, or return None if the peer closed."""
+        data = bytearray()
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return bytes(data)
+
+    def close(self) -> None:
+        """Stop listening and wait for the serving thread to finish."""
+        self._listener.close()
+        self._thread.join(timeout=5.0)
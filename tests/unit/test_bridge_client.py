@@ -2,15 +2,17 @@
 Unit Tests for Bridge Client Module.
 
 Tests socket client connection, message framing, and error handling.
-Uses mock sockets to test without requiring a running Blender instance.
+Uses mock and fake sockets, plus a loopback server for end-to-end framing,
+to test without requiring a running Blender instance.
 """
 
 from __future__ import annotations
 
+import gc
 import socket
 import struct
 import threading
-import time
+from collections.abc import Callable, Generator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +22,9 @@ from src.bridge.client import (
     DEFAULT_HOST,
     DEFAULT_PORT,
     HEADER_SIZE,
+    HEADER_STRUCT,
+    SEND_BUFFER_SIZE,
+    SEND_POOL_SIZE,
     BlenderClient,
 )
 from src.bridge.exceptions import (
@@ -34,6 +39,33 @@ from src.bridge.protocol import (
     Request,
     create_success_response,
 )
+from tests.unit.fakes import FakeSocket, LoopbackServer
+
+# Stand-in id used to pre-serialize echoed mock responses
+ID_PLACEHOLDER = "__ID_PLACEHOLDER__"
+
+
+@pytest.fixture
+def connected_client() -> Generator[tuple[BlenderClient, FakeSocket], None, None]:
+    """Provide a client connected to a fake socket, plus that socket."""
+    fake_socket = FakeSocket()
+    with patch("socket.socket", return_value=fake_socket):
+        client = BlenderClient()
+        client.connect()
+        yield client, fake_socket
+
+
+@pytest.fixture
+def loopback_client() -> Generator[tuple[BlenderClient, LoopbackServer], None, None]:
+    """Provide a client connected over real TCP to a loopback server."""
+    server = LoopbackServer()
+    client = BlenderClient(host=server.host, port=server.port)
+    client.connect()
+    try:
+        yield client, server
+    finally:
+        client.disconnect()
+        server.close()
 
 
 class TestBlenderClientInit:
@@ -63,6 +95,13 @@ class TestBlenderClientInit:
         assert abs(client.timeout - 30.0) < 0.001
         assert abs(client.connect_timeout - 10.0) < 0.001
 
+    def test_rejects_unknown_attributes(self) -> None:
+        """Test that the client's slotted layout rejects stray attributes."""
+        client = BlenderClient()
+
+        with pytest.raises(AttributeError):
+            client.retries = 3  # type: ignore[attr-defined]
+
 
 class TestBlenderClientConnect:
     """Tests for BlenderClient connection methods."""
@@ -78,6 +117,12 @@ class TestBlenderClientConnect:
             client.connect()
 
             mock_socket.connect.assert_called_once_with((DEFAULT_HOST, DEFAULT_PORT))
+            mock_socket.setsockopt.assert_any_call(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
+            mock_socket.setsockopt.assert_any_call(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE
+            )
             assert client.is_connected is True
 
     def test_connect_already_connected(self) -> None:
@@ -141,6 +186,31 @@ class TestBlenderClientConnect:
             mock_socket.close.assert_called()
             assert client.is_connected is False
 
+    def test_garbage_collected_client_closes_socket(self) -> None:
+        """Test that a client dropped while connected still closes its socket."""
+        fake_socket = FakeSocket()
+        with patch("socket.socket", return_value=fake_socket):
+            client = BlenderClient()
+            client.connect()
+
+        del client
+        gc.collect()
+
+        assert fake_socket.close_count == 1
+
+    def test_disconnect_detaches_finalizer(self) -> None:
+        """Test that a disconnected client does not close its socket again."""
+        fake_socket = FakeSocket()
+        with patch("socket.socket", return_value=fake_socket):
+            client = BlenderClient()
+            client.connect()
+
+        client.disconnect()
+        del client
+        gc.collect()
+
+        assert fake_socket.close_count == 1
+
     def test_disconnect_when_not_connected(self) -> None:
         """Test disconnecting when not connected is safe."""
         client = BlenderClient()
@@ -179,74 +249,122 @@ class TestBlenderClientContextManager:
 class TestMessageFraming:
     """Tests for message framing (4-byte length prefix)."""
 
-    def test_send_message_framing(self) -> None:
+    def test_send_message_framing(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
         """Test that messages are sent with correct length prefix."""
-        client = BlenderClient()
+        client, fake_socket = connected_client
+
+        # Access private method for testing
+        test_data = b'{"test": "data"}'
+        client._send_message(test_data)
+
+        # Verify header and payload were handed over as one two-segment send
+        expected = struct.pack(f">I{len(test_data)}s", len(test_data), test_data)
+        assert fake_socket.sent_buffers == [[expected[:HEADER_SIZE], test_data]]
+        assert fake_socket.sent == [expected]
+        # The framing pool is only allocated on the non-sendmsg path
+        assert client._send_buf is None
+
+    def test_send_message_framing_without_sendmsg(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
+        """Test that platforms without sendmsg send one combined buffer."""
+        client, fake_socket = connected_client
+
+        long_data = b'{"test": "a longer payload"}'
+        test_data = b'{"test": "data"}'
+        with patch("src.bridge.client.HAS_SENDMSG", False):
+            client._send_message(long_data)
+            client._send_message(test_data)  # Reuses the pooled buffer
+
+        expected = struct.pack(f">I{len(test_data)}s", len(test_data), test_data)
+        assert fake_socket.sent_buffers == []
+        assert fake_socket.sent[-1] == expected
+
+    def test_send_message_larger_than_pool(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
+        """Test that messages beyond the pooled buffer are framed intact."""
+        client, fake_socket = connected_client
+
+        test_data = b"x" * (SEND_POOL_SIZE + 1)
+        with patch("src.bridge.client.HAS_SENDMSG", False):
+            client._send_message(test_data)
 
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
+        assert fake_socket.sent == [HEADER_STRUCT.pack(len(test_data)) + test_data]
 
-            client.connect()
+    @pytest.mark.parametrize("send_limit", [2, HEADER_SIZE + 3])
+    def test_send_message_partial_sendmsg(
+        self, connected_client: tuple[BlenderClient, FakeSocket], send_limit: int
+    ) -> None:
+        """Test that a partial sendmsg is completed with the remaining bytes."""
+        client, fake_socket = connected_client
+        fake_socket.send_limit = send_limit
 
-            # Access private method for testing
-            test_data = b'{"test": "data"}'
-            client._send_message(test_data)
+        test_data = b'{"test": "data"}'
+        client._send_message(test_data)
 
-            # Verify sendall was called with length prefix + data
-            call_args = mock_socket.sendall.call_args[0][0]
-            expected_prefix = struct.pack(">I", len(test_data))
-            assert call_args == expected_prefix + test_data
+        expected = struct.pack(f">I{len(test_data)}s", len(test_data), test_data)
+        assert b"".join(fake_socket.sent) == expected
 
-    def test_receive_message_framing(self) -> None:
+    def test_receive_message_framing(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
         """Test that messages are received with correct length handling."""
-        client = BlenderClient()
+        client, fake_socket = connected_client
 
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
+        # Prepare mock response
+        response_data = (
+            b'{"jsonrpc": "2.0", "id": "test", "result": {"status": "success"}}'
+        )
+        length_prefix = HEADER_STRUCT.pack(len(response_data))
 
-            client.connect()
+        # Deliver the whole frame as one blob
+        fake_socket.feed(length_prefix + response_data)
 
-            # Prepare mock response
-            response_data = (
-                b'{"jsonrpc": "2.0", "id": "test", "result": {"status": "success"}}'
-            )
-            length_prefix = struct.pack(">I", len(response_data))
+        result = client._receive_message()
 
-            # Mock recv to return length prefix then data
-            mock_socket.recv.side_effect = [length_prefix, response_data]
+        assert result == response_data
 
-            result = client._receive_message()
+    def test_receive_message_fragmented(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
+        """Test receiving fragmented message."""
+        client, fake_socket = connected_client
 
-            assert result == response_data
+        response_data = (
+            b'{"jsonrpc": "2.0", "id": "test", "result": {"status": "success"}}'
+        )
+        length_prefix = HEADER_STRUCT.pack(len(response_data))
 
-    def test_receive_message_fragmented(self) -> None:
-        """Test receiving fragmented message."""
-        client = BlenderClient()
+        # Simulate fragmented receive: 3 bytes per read splits the header
+        # across two reads and the data across many
+        fake_socket.feed(length_prefix + response_data)
+        fake_socket.recv_limit = 3
 
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
+        result = client._receive_message()
 
-            client.connect()
+        assert result == response_data
+        header_reads = -(-HEADER_SIZE // 3)
+        data_reads = -(-len(response_data) // 3)
+        assert fake_socket.recv_count == header_reads + data_reads
 
-            response_data = (
-                b'{"jsonrpc": "2.0", "id": "test", "result": {"status": "success"}}'
-            )
-            length_prefix = struct.pack(">I", len(response_data))
+    def test_receive_large_message(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
+        """Test that a 1 MB body arriving in socket-sized pieces is reassembled."""
+        client, fake_socket = connected_client
 
-            # Simulate fragmented receive (2 bytes at a time for header, then data in chunks)
-            mock_socket.recv.side_effect = [
-                length_prefix[:2],  # First 2 bytes of header
-                length_prefix[2:],  # Last 2 bytes of header
-                response_data[:10],  # First chunk of data
-                response_data[10:],  # Rest of data
-            ]
+        response_data = bytes(range(256)) * 4096  # 1 MB
+        fake_socket.feed(HEADER_STRUCT.pack(len(response_data)) + response_data)
+        fake_socket.recv_limit = 64 * 1024
 
-            result = client._receive_message()
+        result = client._receive_message()
 
-            assert result == response_data
+        assert result == response_data
+        # Header read plus one read per 64 KB piece written in place
+        assert fake_socket.recv_count == 1 + len(response_data) // (64 * 1024)
 
 
 class TestBlenderClientOperations:
@@ -268,166 +386,91 @@ class TestBlenderClientOperations:
             response = create_error_response(request_id, error or "Error")
 
         response_bytes = response.to_bytes()
-        length_prefix = struct.pack(">I", len(response_bytes))
+        length_prefix = HEADER_STRUCT.pack(len(response_bytes))
         return length_prefix + response_bytes
 
-    def test_ping_success(self) -> None:
-        """Test successful ping."""
-        client = BlenderClient()
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
-
-            client.connect()
-
-            # We need to capture the request ID from send to match response
-            sent_data = []
-
-            def capture_send(data: bytes) -> None:
-                sent_data.append(data)
-
-            mock_socket.sendall.side_effect = capture_send
-
-            # Create response after request is captured
-            def mock_recv(size: int) -> bytes:
-                if not sent_data:
-                    return b""
-
-                # Parse request ID from sent data
-                import json
-
-                request_bytes = sent_data[0][HEADER_SIZE:]
-                request = json.loads(request_bytes)
-                request_id = request["id"]
-
-                response = self._create_mock_response(
-                    request_id, success=True, data={"pong": True}
-                )
-
-                if size == HEADER_SIZE:
-                    return response[:HEADER_SIZE]
-                return response[HEADER_SIZE:]
-
-            mock_socket.recv.side_effect = mock_recv
-
-            elapsed = client.ping()
-
-            assert elapsed >= 0
+    def _echo_reply(
+        self,
+        success: bool = True,
+        data: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> Callable[[bytes], bytes]:
+        """
+        Build a server reply that answers each request with its own id.
+
+        The response body is serialized once around a placeholder id; each
+        reply only splices in the id of the received request.
+        """
+        template = self._create_mock_response(ID_PLACEHOLDER, success, data, error)
+        head, _, tail = template[HEADER_SIZE:].partition(ID_PLACEHOLDER.encode())
+
+        def reply(body: bytes) -> bytes:
+            return head + Request.from_bytes(body).id.encode("utf-8") + tail
+
+        return reply
+
+    @pytest.mark.parametrize(
+        ("method", "args", "response", "expected"),
+        [
+            pytest.param("ping", (), {"data": {"pong": True}}, float, id="ping"),
+            pytest.param(
+                "execute",
+                ("print('hello')",),
+                {"data": {"executed": True}},
+                {"data": {"executed": True}, "logs": ""},
+                id="execute",
+            ),
+            pytest.param(
+                "query",
+                ("objects",),
+                {"data": {"objects": ["Cube", "Camera"]}},
+                {"objects": ["Cube", "Camera"]},
+                id="query",
+            ),
+            pytest.param(
+                "execute",
+                ("invalid python code (",),
+                {"success": False, "error": "SyntaxError: invalid syntax"},
+                ExecutionError,
+                id="execute-error",
+            ),
+        ],
+    )
+    def test_operation_round_trip(
+        self,
+        loopback_client: tuple[BlenderClient, LoopbackServer],
+        method: str,
+        args: tuple[str, ...],
+        response: dict[str, Any],
+        expected: Any,
+    ) -> None:
+        """Test that ping/execute/query return or raise per the echoed response."""
+        client, server = loopback_client
+        server.reply = self._echo_reply(**response)
+        operation = getattr(client, method)
+
+        if expected is ExecutionError:
+            with pytest.raises(ExecutionError, match="SyntaxError"):
+                operation(*args)
+        elif expected is float:
+            elapsed = operation(*args)
             assert isinstance(elapsed, float)
+            assert elapsed >= 0
+        else:
+            assert operation(*args) == expected
 
-    def test_execute_success(self) -> None:
-        """Test successful code execution."""
-        client = BlenderClient()
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
-
-            client.connect()
-
-            sent_data = []
-            mock_socket.sendall.side_effect = lambda d: sent_data.append(d)
-
-            def mock_recv(size: int) -> bytes:
-                if not sent_data:
-                    return b""
-
-                import json
-
-                request_bytes = sent_data[0][HEADER_SIZE:]
-                request = json.loads(request_bytes)
-                request_id = request["id"]
-
-                response = self._create_mock_response(
-                    request_id, success=True, data={"executed": True}
-                )
-
-                if size == HEADER_SIZE:
-                    return response[:HEADER_SIZE]
-                return response[HEADER_SIZE:]
-
-            mock_socket.recv.side_effect = mock_recv
-
-            result = client.execute("print('hello')")
-
-            assert "data" in result
-            assert result["data"]["executed"] is True
-
-    def test_execute_error(self) -> None:
-        """Test code execution error."""
-        client = BlenderClient()
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
-
-            client.connect()
-
-            sent_data = []
-            mock_socket.sendall.side_effect = lambda d: sent_data.append(d)
-
-            def mock_recv(size: int) -> bytes:
-                if not sent_data:
-                    return b""
-
-                import json
-
-                request_bytes = sent_data[0][HEADER_SIZE:]
-                request = json.loads(request_bytes)
-                request_id = request["id"]
-
-                response = self._create_mock_response(
-                    request_id, success=False, error="SyntaxError: invalid syntax"
-                )
-
-                if size == HEADER_SIZE:
-                    return response[:HEADER_SIZE]
-                return response[HEADER_SIZE:]
-
-            mock_socket.recv.side_effect = mock_recv
-
-            with pytest.raises(ExecutionError) as exc_info:
-                client.execute("invalid python code (")
-
-            assert "SyntaxError" in str(exc_info.value)
-
-    def test_query_success(self) -> None:
-        """Test successful query."""
-        client = BlenderClient()
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
-
-            client.connect()
-
-            sent_data = []
-            mock_socket.sendall.side_effect = lambda d: sent_data.append(d)
-
-            def mock_recv(size: int) -> bytes:
-                if not sent_data:
-                    return b""
-
-                import json
-
-                request_bytes = sent_data[0][HEADER_SIZE:]
-                request = json.loads(request_bytes)
-                request_id = request["id"]
-
-                response = self._create_mock_response(
-                    request_id, success=True, data={"objects": ["Cube", "Camera"]}
-                )
-
-                if size == HEADER_SIZE:
-                    return response[:HEADER_SIZE]
-                return response[HEADER_SIZE:]
-
-            mock_socket.recv.side_effect = mock_recv
+    def test_request_ids_come_from_client_counter(
+        self, loopback_client: tuple[BlenderClient, LoopbackServer]
+    ) -> None:
+        """Test that successive requests use increasing counter ids."""
+        client, server = loopback_client
+        server.reply = self._echo_reply(data={"pong": True})
 
-            result = client.query("objects")
+        client.ping()
+        client.query("objects")
 
-            assert result["objects"] == ["Cube", "Camera"]
+        sent_ids = [Request.from_bytes(body).id for body in server.received]
+        assert sent_ids == ["1", "2"]
 
 
 class TestBlenderClientErrors:
@@ -448,118 +491,84 @@ class TestBlenderClientErrors:
         with pytest.raises(ConnectionClosedError):
             client.send_request(request)
 
-    def test_receive_timeout(self) -> None:
+    def test_receive_timeout(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
         """Test receive timeout handling."""
-        client = BlenderClient(timeout=0.1)
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
+        client, fake_socket = connected_client
 
-            client.connect()
-
-            # Mock recv to timeout
-            mock_socket.recv.side_effect = socket.timeout("timed out")
-            mock_socket.sendall.return_value = None
+        # Make the first receive time out
+        fake_socket.feed(socket.timeout("timed out"))
 
-            with pytest.raises(ConnectionTimeoutError) as exc_info:
-                client.ping()
+        with pytest.raises(ConnectionTimeoutError) as exc_info:
+            client.ping()
 
-            assert exc_info.value.operation == "receive"
+        assert exc_info.value.operation == "receive"
 
-    def test_connection_closed_during_receive(self) -> None:
+    def test_connection_closed_during_receive(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
         """Test handling of connection closed during receive."""
-        client = BlenderClient()
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
+        client, _ = connected_client
 
-            client.connect()
-
-            # Mock recv to return empty (connection closed)
-            mock_socket.recv.return_value = b""
-            mock_socket.sendall.return_value = None
-
-            with pytest.raises(ConnectionClosedError):
-                client.ping()
+        # Nothing queued: receives read zero bytes (connection closed)
+        with pytest.raises(ConnectionClosedError):
+            client.ping()
 
-    def test_response_id_mismatch(self) -> None:
+    def test_response_id_mismatch(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
         """Test that response ID mismatch raises error."""
-        client = BlenderClient()
-
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
-
-            client.connect()
-
-            mock_socket.sendall.return_value = None
+        client, fake_socket = connected_client
 
-            # Create response with wrong ID
-            wrong_response = create_success_response("wrong-id", {})
-            response_bytes = wrong_response.to_bytes()
-            length_prefix = struct.pack(">I", len(response_bytes))
+        # Create response with wrong ID
+        wrong_response = create_success_response("wrong-id", {})
+        response_bytes = wrong_response.to_bytes()
+        length_prefix = HEADER_STRUCT.pack(len(response_bytes))
 
-            mock_socket.recv.side_effect = [length_prefix, response_bytes]
+        fake_socket.feed(length_prefix + response_bytes)
 
-            with pytest.raises(ProtocolError) as exc_info:
-                client.ping()
+        with pytest.raises(ProtocolError) as exc_info:
+            client.ping()
 
-            assert "mismatch" in str(exc_info.value)
+        assert "mismatch" in str(exc_info.value)
 
 
 class TestThreadSafety:
     """Tests for thread safety of BlenderClient."""
 
-    def test_concurrent_access(self) -> None:
+    def test_concurrent_access(
+        self, connected_client: tuple[BlenderClient, FakeSocket]
+    ) -> None:
         """Test that client handles concurrent access safely."""
-        client = BlenderClient()
+        client, fake_socket = connected_client
         errors: list[Exception] = []
 
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket = MagicMock()
-            mock_socket_class.return_value = mock_socket
+        # Create proper response
+        response_bytes = create_success_response("any-id", {"pong": True}).to_bytes()
+        framed_response = HEADER_STRUCT.pack(len(response_bytes)) + response_bytes
 
-            client.connect()
+        fake_socket.on_send = lambda _message: fake_socket.feed(framed_response)
 
-            lock = threading.Lock()
-            call_count = [0]
-
-            def mock_sendall(data: bytes) -> None:
-                with lock:
-                    call_count[0] += 1
-                    time.sleep(0.01)  # Simulate network delay
-
-            mock_socket.sendall.side_effect = mock_sendall
-
-            # Create proper response
-            def mock_recv(size: int) -> bytes:
-                response = create_success_response("any-id", {"pong": True})
-                response_bytes = response.to_bytes()
-                length_prefix = struct.pack(">I", len(response_bytes))
-
-                if size == HEADER_SIZE:
-                    return length_prefix
-                return response_bytes
-
-            mock_socket.recv.side_effect = mock_recv
-
-            def worker() -> None:
-                try:
-                    # Note: This won't fully work due to ID mismatch,
-                    # but we're testing that concurrent access doesn't crash
-                    client.ping()
-                except Exception as e:
-                    errors.append(e)
-
-            # Start multiple threads
-            threads = [threading.Thread(target=worker) for _ in range(5)]
-            for t in threads:
-                t.start()
-            for t in threads:
-                t.join()
-
-            # Errors are expected due to ID mismatch in mock,
-            # but no deadlock or crash should occur
-            assert call_count[0] >= 1  # At least one call made it through
+        # Release all workers at once so they contend for the client lock
+        start = threading.Barrier(5)
+
+        def worker() -> None:
+            start.wait(timeout=5)
+            try:
+                # Note: This won't fully work due to ID mismatch,
+                # but we're testing that concurrent access doesn't crash
+                client.ping()
+            except Exception as e:
+                errors.append(e)
+
+        # Start multiple threads
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Errors are expected due to ID mismatch in mock,
+        # but no deadlock or crash should occur
+        assert fake_socket.send_count >= 1  # At least one call made it through
@@ -5,6 +5,7 @@ Tests JSON-RPC message validation, serialization, and error handling.
 """
 
 import json
+from dataclasses import FrozenInstanceError
 
 import pytest
 
@@ -21,6 +22,7 @@ from src.bridge.protocol import (
     create_error_response,
     create_execute_request,
     create_ping_request,
+    create_ping_request_bytes,
     create_query_request,
     create_success_response,
 )
@@ -39,6 +41,15 @@ class TestRequest:
         assert len(request.id) > 0
         assert request.params.timeout == DEFAULT_TIMEOUT_MS
 
+    def test_request_default_id_is_uuid_hex(self) -> None:
+        """Test that generated ids are compact, unique UUID hex strings."""
+        first = Request(method=MessageMethod.PING)
+        second = Request(method=MessageMethod.PING)
+
+        assert len(first.id) == 32
+        assert int(first.id, 16) >= 0
+        assert first.id != second.id
+
     def test_request_creation_custom_id(self) -> None:
         """Test that Request accepts custom ID."""
         custom_id = "custom-test-id"
@@ -84,6 +95,50 @@ class TestRequest:
         parsed = json.loads(decoded)
         assert parsed["method"] == "ping"
 
+    def test_request_to_bytes_matches_to_json(self) -> None:
+        """Test that to_bytes and to_json carry the same serialized payload."""
+        request = Request(
+            method=MessageMethod.EXECUTE_CODE,
+            params=RequestParams(code="print('héllo')"),
+            id="test-id",
+        )
+
+        assert request.to_bytes() == request.to_json().encode("utf-8")
+
+    def test_request_is_immutable(self) -> None:
+        """Test that a built request cannot be modified."""
+        request = Request(method=MessageMethod.PING, id="test-id")
+
+        with pytest.raises(FrozenInstanceError):
+            request.id = "other-id"  # type: ignore[misc]
+
+    def test_request_to_bytes_is_cached(self) -> None:
+        """Test that repeated serialization reuses the first encoding."""
+        request = Request(method=MessageMethod.PING, id="test-id")
+
+        assert request.to_bytes() is request.to_bytes()
+
+    def test_response_result_is_immutable_after_encoding(self) -> None:
+        """Test that a cached response cannot drift from its encoded bytes."""
+        response = create_success_response("test-id", {"x": 1})
+        encoded = response.to_bytes()
+
+        with pytest.raises(FrozenInstanceError):
+            response.result.data = {"x": 2}  # type: ignore[misc]
+        with pytest.raises(FrozenInstanceError):
+            response.result.logs = "changed"  # type: ignore[misc]
+
+        assert response.to_bytes() == encoded
+        assert json.loads(encoded) == response.to_dict()
+
+    def test_protocol_messages_are_slotted(self) -> None:
+        """Test that protocol dataclasses carry no per-instance __dict__."""
+        request = create_execute_request("x = 1")
+        response = create_success_response("test-id")
+
+        for message in (request, request.params, response, response.result):
+            assert not hasattr(message, "__dict__")
+
     def test_request_from_dict_valid(self) -> None:
         """Test parsing Request from valid dictionary."""
         data = {
@@ -145,6 +200,15 @@ class TestRequest:
 
         assert "Unknown method" in str(exc_info.value)
 
+    def test_request_from_dict_non_string_method(self) -> None:
+        """Test that a non-string method raises ProtocolError."""
+        data = {"jsonrpc": "2.0", "id": "test-id", "method": ["ping"]}
+
+        with pytest.raises(ProtocolError) as exc_info:
+            Request.from_dict(data)
+
+        assert "Unknown method" in str(exc_info.value)
+
     def test_request_from_json_valid(self) -> None:
         """Test parsing Request from valid JSON string."""
         json_str = '{"jsonrpc": "2.0", "id": "test-id", "method": "ping", "params": {}}'
@@ -259,6 +323,17 @@ class TestResponse:
         assert result["result"]["error"] == "Something went wrong"
         assert result["result"]["traceback"] == "Traceback..."
 
+    def test_response_to_dict_omits_unset_fields(self) -> None:
+        """Test that empty optional result fields are left off the wire."""
+        response = create_success_response("test-id")
+
+        result = response.to_dict()
+
+        assert result["result"] == {"status": "success"}
+        restored = Response.from_json(response.to_json())
+        assert restored.result.data == {}
+        assert restored.result.logs == ""
+
     def test_response_to_json_valid(self) -> None:
         """Test that to_json produces valid JSON."""
         response = Response(
@@ -319,11 +394,40 @@ class TestResponse:
 
         assert "Missing required field: result" in str(exc_info.value)
 
+    def test_response_from_dict_invalid_status(self) -> None:
+        """Test that an unknown result status raises ProtocolError."""
+        data = {"jsonrpc": "2.0", "id": "test-id", "result": {"status": "maybe"}}
+
+        with pytest.raises(ProtocolError) as exc_info:
+            Response.from_dict(data)
+
+        assert "Invalid status" in str(exc_info.value)
+
+    def test_response_from_dict_null_optional_fields(self) -> None:
+        """Test that null data and logs read back as their defaults."""
+        data = {
+            "jsonrpc": "2.0",
+            "id": "test-id",
+            "result": {"status": "success", "data": None, "logs": None},
+        }
+
+        response = Response.from_dict(data)
+
+        assert response.result.data == {}
+        assert response.result.logs == ""
+
     def test_response_from_json_invalid(self) -> None:
         """Test that invalid JSON raises ProtocolError."""
         with pytest.raises(ProtocolError):
             Response.from_json("invalid json{")
 
+    def test_response_from_bytes_invalid_utf8(self) -> None:
+        """Test that bytes that are not UTF-8 raise ProtocolError."""
+        with pytest.raises(ProtocolError) as exc_info:
+            Response.from_bytes(b'{"id": "\xff"}')
+
+        assert "Invalid JSON" in str(exc_info.value)
+
     def test_response_roundtrip(self) -> None:
         """Test that Response survives serialization roundtrip."""
         original = Response(
@@ -371,6 +475,23 @@ class TestFactoryFunctions:
         assert request.method == MessageMethod.PING
         assert request.id is not None
 
+    def test_create_ping_request_bytes_matches_request(self) -> None:
+        """Test the ping template decodes to the same JSON as a ping Request."""
+        raw = create_ping_request_bytes('ping-"1"')
+        request = create_ping_request('ping-"1"')
+
+        # Equivalent JSON, not identical bytes: key order is not guaranteed
+        assert json.loads(raw) == json.loads(request.to_bytes())
+        assert json.loads(raw) == request.to_dict()
+        assert Request.from_bytes(raw).method == MessageMethod.PING
+
+    def test_create_ping_request_bytes_generates_id(self) -> None:
+        """Test the ping template generates a fresh id when omitted."""
+        first = Request.from_bytes(create_ping_request_bytes())
+        second = Request.from_bytes(create_ping_request_bytes())
+
+        assert first.id != second.id
+
     def test_create_execute_request(self) -> None:
         """Test create_execute_request factory."""
         code = "bpy.ops.mesh.primitive_cube_add()"
@@ -393,6 +514,12 @@ class TestFactoryFunctions:
         assert request.method == MessageMethod.QUERY_SCENE
         assert request.params.query == "objects"
 
+    def test_create_requests_with_explicit_id(self) -> None:
+        """Test that factories use a caller-supplied request id."""
+        assert create_ping_request(request_id="7").id == "7"
+        assert create_execute_request("x = 1", request_id="8").id == "8"
+        assert create_query_request("objects", request_id="9").id == "9"
+
     def test_create_success_response(self) -> None:
         """Test create_success_response factory."""
         response = create_success_response(
@@ -454,6 +581,33 @@ class TestEdgeCases:
         assert request.params.code is None
         assert request.params.timeout == DEFAULT_TIMEOUT_MS
 
+    def test_empty_params_are_shared(self) -> None:
+        """Test that params-less requests reuse one frozen params instance."""
+        data = {"jsonrpc": "2.0", "id": "test-id", "method": "ping", "params": {}}
+
+        parsed = Request.from_dict(data)
+        built = create_ping_request("other-id")
+
+        assert parsed.params is built.params
+        with pytest.raises(FrozenInstanceError):
+            parsed.params.code = "x = 1"  # type: ignore[misc]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_shared_empty_params_are_read_only(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test that the shared params cannot leak changes between requests."""
+        if not use_orjson:
+            monkeypatch.setattr("src.bridge.protocol.ORJSON_AVAILABLE", False)
+        request = create_ping_request("test-id")
+        other = create_ping_request("other-id")
+
+        with pytest.raises(TypeError):
+            request.params.extra["leak"] = True  # type: ignore[index]
+
+        assert "leak" not in other.params.extra
+        assert json.loads(request.to_bytes())["params"]["extra"] == {}
+
     def test_unicode_in_code(self) -> None:
         """Test handling of unicode characters in code."""
         code = "print('こんにちは世界 🌍')"
@@ -486,3 +640,89 @@ class TestEdgeCases:
         restored = Response.from_json(json_str)
 
         assert restored.result.error == error_msg
+
+    def test_response_with_nan_from_stdlib_peer(self) -> None:
+        """Test parsing NaN literals that stdlib json.dumps can emit."""
+        json_str = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": "test-id",
+                "result": {"status": "success", "data": {"value": float("nan")}},
+            }
+        )
+
+        restored = Response.from_json(json_str)
+
+        assert restored.result.data["value"] != restored.result.data["value"]
+
+    def test_non_finite_floats_serialize_as_null(self) -> None:
+        """Test that NaN and Infinity are written as strict-JSON null."""
+        response = create_success_response(
+            request_id="test-id",
+            data={"nan": float("nan"), "inf": float("inf")},
+        )
+
+        parsed = json.loads(response.to_json())
+
+        assert parsed["result"]["data"] == {"nan": None, "inf": None}
+
+    def test_non_finite_floats_serialize_as_null_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the stdlib fallback also writes NaN and Infinity as null."""
+        monkeypatch.setattr("src.bridge.protocol.ORJSON_AVAILABLE", False)
+        response = create_success_response(
+            request_id="test-id",
+            data={"nan": float("nan"), "inf": [float("-inf"), 1.5]},
+        )
+
+        raw = response.to_bytes()
+
+        assert b"NaN" not in raw
+        assert b"Infinity" not in raw
+        assert json.loads(raw)["result"]["data"] == {"nan": None, "inf": [None, 1.5]}
+
+    def test_non_finite_floats_with_big_ints_serialize_as_null(self) -> None:
+        """Test that orjson's stdlib fallback for big ints also nulls NaN."""
+        response = create_success_response(
+            request_id="test-id",
+            data={"big": 2**70, "nan": float("nan")},
+        )
+
+        raw = response.to_bytes()
+
+        assert b"NaN" not in raw
+        assert json.loads(raw)["result"]["data"] == {"big": 2**70, "nan": None}
+
+    def test_non_string_keys_and_big_ints_serialize(self) -> None:
+        """Test that values json.dumps accepts still serialize."""
+        response = create_success_response(
+            request_id="test-id",
+            data={1: "one", "big": 2**70},
+        )
+
+        parsed = json.loads(response.to_json())
+
+        assert parsed["result"]["data"] == {"1": "one", "big": 2**70}
+
+    def test_roundtrip_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the stdlib json fallback serializes and parses messages."""
+        monkeypatch.setattr("src.bridge.protocol.ORJSON_AVAILABLE", False)
+        original = create_success_response("test-id", {"items": [1, 2, 3]})
+
+        restored = Response.from_bytes(original.to_bytes())
+
+        assert restored.id == "test-id"
+        assert restored.result.data == {"items": [1, 2, 3]}
+
+    def test_request_bytes_match_dict_form(self) -> None:
+        """Test that direct dataclass encoding carries the to_dict content."""
+        big = Request(
+            method=MessageMethod.EXECUTE_CODE,
+            params=RequestParams(code="x = 1", extra={"seed": 2**70}),
+            id="test-id",
+        )
+        plain = create_query_request("objects", request_id="q-id")
+
+        for request in (big, plain):
+            assert json.loads(request.to_bytes()) == request.to_dict()
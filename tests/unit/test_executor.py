@@ -5,7 +5,9 @@ Tests for safe execution, retry logic, and execution history.
 """
 
 import asyncio
+from dataclasses import FrozenInstanceError
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -18,7 +20,7 @@ from src.executor.history import (
     ExecutionStatus,
 )
 from src.executor.retry import RetryConfig, RetryManager
-from src.executor.safe_exec import ExecutionResult, SafeExecutor
+from src.executor.safe_exec import ExecutionResult, SafeExecutor, _check_syntax
 
 
 class TestSafeExecutorValidation:
@@ -42,6 +44,16 @@ class TestSafeExecutorValidation:
         assert error is not None
         assert line is not None
 
+    def test_validate_syntax_reuses_cached_result(self) -> None:
+        """Test that validating the same code twice parses it only once."""
+        executor = SafeExecutor()
+        code = "import bpy\ncached = True"
+        executor.validate_syntax(code)
+        hits_before = _check_syntax.cache_info().hits
+
+        assert executor.validate_syntax(code) == (True, None, None)
+        assert _check_syntax.cache_info().hits == hits_before + 1
+
     def test_detect_patterns_os_import(self) -> None:
         """Test detection of os import pattern."""
         executor = SafeExecutor()
@@ -56,6 +68,13 @@ class TestSafeExecutorValidation:
 
         assert "file open operation" in patterns
 
+    def test_detect_patterns_multiple_in_declared_order(self) -> None:
+        """Test that every matching pattern is reported, in declaration order."""
+        executor = SafeExecutor()
+        patterns = executor.detect_patterns("exec(open('setup.py').read())")
+
+        assert patterns == ["file open operation", "exec call"]
+
     def test_detect_patterns_no_matches(self) -> None:
         """Test when no patterns match."""
         executor = SafeExecutor()
@@ -167,6 +186,31 @@ class TestRetryConfig:
         delay = config.get_delay(5)
         assert abs(delay - 5.0) < 0.001
 
+    def test_get_delay_beyond_max_attempts(self) -> None:
+        """Test delays past the precomputed attempts follow the same curve."""
+        config = RetryConfig(max_attempts=2, initial_delay=1.0, jitter=False)
+
+        assert [config.get_delay(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 8.0]
+
+    def test_huge_backoff_is_capped_instead_of_overflowing(self) -> None:
+        """Test that an overflowing backoff curve falls back to max_delay."""
+        config = RetryConfig(
+            max_attempts=5,
+            initial_delay=1.0,
+            max_delay=5.0,
+            exponential_base=1e308,
+            jitter=False,
+        )
+
+        assert [config.get_delay(n) for n in (1, 2, 4, 50)] == [1.0, 5.0, 5.0, 5.0]
+
+    def test_config_is_immutable(self) -> None:
+        """Test that the config cannot change after its delays are computed."""
+        config = RetryConfig()
+
+        with pytest.raises(FrozenInstanceError):
+            config.max_attempts = 10  # type: ignore[misc]
+
 
 class TestRetryManager:
     """Tests for retry manager."""
@@ -230,6 +274,31 @@ class TestRetryManager:
 
         assert exc_info.value.attempts == 2
 
+    @pytest.mark.asyncio
+    async def test_zero_delay_skips_sleep(self) -> None:
+        """Test a zero backoff retries without yielding to the event loop."""
+        results = [
+            {"success": False, "error": {"message": "Failed"}},
+            {"success": True},
+        ]
+
+        async def execute_fn(code: str) -> dict[str, Any]:
+            return results.pop(0)
+
+        async def fix_fn(code: str, error: str) -> str:
+            return code + " # fixed"
+
+        config = RetryConfig(max_attempts=2, initial_delay=0.0)
+        manager = RetryManager(config=config)
+
+        with patch("src.executor.retry.asyncio.sleep") as sleep:
+            _, attempts = await manager.execute_with_retry(
+                execute_fn=execute_fn, fix_fn=fix_fn, code="test"
+            )
+
+        assert attempts == 2
+        sleep.assert_not_called()
+
 
 class TestExecutionHistory:
     """Tests for execution history tracking."""
@@ -290,6 +359,20 @@ class TestExecutionHistory:
         # 3 successes (SUCCESS + SUCCESS + FIXED) out of 4
         assert history.success_rate == pytest.approx(0.75)
 
+    def test_success_rate_tracks_evictions_and_clear(self) -> None:
+        """Test that success rate only counts retained records."""
+        history = ExecutionHistory(max_records=2)
+        history.add_record("r1", "c1", ExecutionStatus.SUCCESS)
+        history.add_record("r2", "c2", ExecutionStatus.FAILED)
+        history.add_record("r3", "c3", ExecutionStatus.TIMEOUT)  # Evicts r1
+
+        assert history.success_rate == pytest.approx(0.0)
+
+        history.clear()
+        history.add_record("r4", "c4", ExecutionStatus.FIXED)
+
+        assert history.success_rate == pytest.approx(1.0)
+
     def test_max_records_limit(self) -> None:
         """Test records are limited to max."""
         history = ExecutionHistory(max_records=5)
@@ -299,6 +382,16 @@ class TestExecutionHistory:
 
         assert history.count == 5
 
+    def test_max_records_keeps_newest(self) -> None:
+        """Test that the oldest records are evicted first."""
+        history = ExecutionHistory(max_records=3)
+
+        for i in range(5):
+            history.add_record(f"req{i}", f"code{i}", ExecutionStatus.SUCCESS)
+
+        recent = history.get_recent(10)
+        assert [r.user_request for r in recent] == ["req4", "req3", "req2"]
+
     def test_clear(self) -> None:
         """Test clearing history."""
         history = ExecutionHistory()
@@ -5,10 +5,12 @@ Tests for the Google Gemini AI provider integration.
 Uses mocking to avoid actual API calls.
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.ai import gemini_provider
 from src.ai.exceptions import (
     APIKeyMissingError,
     ModelUnavailableError,
@@ -17,6 +19,40 @@ from src.ai.gemini_provider import GeminiProvider
 from src.ai.provider import GenerationResult, ProviderType
 
 
+def _response(text: str, tokens: tuple[int, int, int] | None = None) -> SimpleNamespace:
+    """Build a stand-in for a Gemini response with optional token usage."""
+    usage = None
+    if tokens is not None:
+        usage = SimpleNamespace(
+            prompt_token_count=tokens[0],
+            candidates_token_count=tokens[1],
+            total_token_count=tokens[2],
+        )
+    return SimpleNamespace(text=text, usage_metadata=usage)
+
+
+@pytest.fixture
+def mock_genai(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the genai module used by the provider with a fresh mock."""
+    mock = MagicMock()
+    monkeypatch.setattr(gemini_provider, "genai", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_model(mock_genai: MagicMock) -> MagicMock:
+    """Return the GenerativeModel the provider will talk to, ready to await."""
+    model: MagicMock = mock_genai.GenerativeModel.return_value
+    model.generate_content_async = AsyncMock()
+    return model
+
+
+@pytest.fixture
+def provider(mock_model: MagicMock) -> GeminiProvider:
+    """Provide a GeminiProvider built against the mocked genai module."""
+    return GeminiProvider(api_key="test-key")
+
+
 class TestGeminiProviderInit:
     """Tests for GeminiProvider initialization."""
 
@@ -28,31 +64,32 @@ class TestGeminiProviderInit:
 
             assert "GEMINI_API_KEY" in str(exc_info.value)
 
-    @patch("src.ai.gemini_provider.genai")
     def test_init_with_api_key_param(self, mock_genai: MagicMock) -> None:
         """Test initialization with API key parameter."""
         provider = GeminiProvider(api_key="test-key")
 
-        mock_genai.configure.assert_called_once_with(api_key="test-key")
+        assert mock_genai.configure.call_count == 1
+        assert mock_genai.configure.call_args.kwargs == {"api_key": "test-key"}
         assert provider.model == "gemini-2.0-flash"
 
-    @patch("src.ai.gemini_provider.genai")
-    @patch.dict("os.environ", {"GEMINI_API_KEY": "env-key"})
-    def test_init_with_env_api_key(self, mock_genai: MagicMock) -> None:
+    def test_init_with_env_api_key(
+        self, mock_genai: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test initialization with API key from environment."""
+        monkeypatch.setenv("GEMINI_API_KEY", "env-key")
+
         provider = GeminiProvider()
 
-        mock_genai.configure.assert_called_once_with(api_key="env-key")
+        assert mock_genai.configure.call_count == 1
+        assert mock_genai.configure.call_args.kwargs == {"api_key": "env-key"}
         assert provider.model == "gemini-2.0-flash"
 
-    @patch("src.ai.gemini_provider.genai")
     def test_init_with_custom_model(self, mock_genai: MagicMock) -> None:
         """Test initialization with custom model."""
         provider = GeminiProvider(api_key="test-key", model="gemini-1.5-pro")
 
         assert provider.model == "gemini-1.5-pro"
 
-    @patch("src.ai.gemini_provider.genai")
     def test_init_with_invalid_model_raises(self, mock_genai: MagicMock) -> None:
         """Test initialization with invalid model raises error."""
         with pytest.raises(ModelUnavailableError) as exc_info:
@@ -64,22 +101,22 @@ class TestGeminiProviderInit:
 class TestGeminiProviderProperties:
     """Tests for GeminiProvider properties."""
 
-    @patch("src.ai.gemini_provider.genai")
-    def test_provider_type(self, mock_genai: MagicMock) -> None:
-        """Test provider_type returns GEMINI."""
-        provider = GeminiProvider(api_key="test-key")
-        assert provider.provider_type == ProviderType.GEMINI
-
-    @patch("src.ai.gemini_provider.genai")
-    def test_default_model(self, mock_genai: MagicMock) -> None:
-        """Test default_model returns expected value."""
-        provider = GeminiProvider(api_key="test-key")
-        assert provider.default_model == "gemini-2.0-flash"
-
-    @patch("src.ai.gemini_provider.genai")
-    def test_available_models(self, mock_genai: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("provider_type", ProviderType.GEMINI),
+            ("default_model", "gemini-2.0-flash"),
+            ("model", "gemini-2.0-flash"),
+        ],
+    )
+    def test_provider_attr(
+        self, provider: GeminiProvider, attr: str, expected: object
+    ) -> None:
+        """Test provider identity and model defaults."""
+        assert getattr(provider, attr) == expected
+
+    def test_available_models(self, provider: GeminiProvider) -> None:
         """Test available_models returns list of models."""
-        provider = GeminiProvider(api_key="test-key")
         models = provider.available_models
 
         assert len(models) == 4
@@ -88,39 +125,34 @@ class TestGeminiProviderProperties:
         assert "gemini-1.5-pro" in model_names
         assert "gemini-1.5-flash" in model_names
 
-    @patch("src.ai.gemini_provider.genai")
-    def test_change_model_reinitializes_client(self, mock_genai: MagicMock) -> None:
+    def test_change_model_reinitializes_client(
+        self, provider: GeminiProvider, mock_genai: MagicMock
+    ) -> None:
         """Test changing model reinitializes the client."""
-        provider = GeminiProvider(api_key="test-key")
-        initial_calls = mock_genai.GenerativeModel.call_count
+        mock_genai.GenerativeModel.reset_mock()
 
         provider.model = "gemini-1.5-pro"
 
-        # Should have called GenerativeModel again
-        assert mock_genai.GenerativeModel.call_count > initial_calls
+        # Should have built exactly one new GenerativeModel for the new model
+        mock_genai.GenerativeModel.assert_called_once()
+        assert (
+            mock_genai.GenerativeModel.call_args.kwargs["model_name"]
+            == "gemini-1.5-pro"
+        )
 
 
 class TestGeminiProviderGenerateCode:
     """Tests for code generation."""
 
-    @patch("src.ai.gemini_provider.genai")
     @pytest.mark.asyncio
-    async def test_generate_code_success(self, mock_genai: MagicMock) -> None:
+    async def test_generate_code_success(
+        self, provider: GeminiProvider, mock_model: MagicMock
+    ) -> None:
         """Test successful code generation."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.text = "import bpy\nbpy.ops.mesh.primitive_cube_add()"
-        mock_response.usage_metadata = MagicMock(
-            prompt_token_count=10,
-            candidates_token_count=20,
-            total_token_count=30,
+        mock_model.generate_content_async.return_value = _response(
+            "import bpy\nbpy.ops.mesh.primitive_cube_add()", tokens=(10, 20, 30)
         )
 
-        mock_model = MagicMock()
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
-        mock_genai.GenerativeModel.return_value = mock_model
-
-        provider = GeminiProvider(api_key="test-key")
         result = await provider.generate_code("create a cube")
 
         assert isinstance(result, GenerationResult)
@@ -128,19 +160,13 @@ class TestGeminiProviderGenerateCode:
         assert result.model_used == "gemini-2.0-flash"
         assert result.total_tokens == 30
 
-    @patch("src.ai.gemini_provider.genai")
     @pytest.mark.asyncio
-    async def test_generate_code_with_context(self, mock_genai: MagicMock) -> None:
+    async def test_generate_code_with_context(
+        self, provider: GeminiProvider, mock_model: MagicMock
+    ) -> None:
         """Test code generation with context."""
-        mock_response = MagicMock()
-        mock_response.text = "import bpy"
-        mock_response.usage_metadata = None
-
-        mock_model = MagicMock()
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
-        mock_genai.GenerativeModel.return_value = mock_model
+        mock_model.generate_content_async.return_value = _response("import bpy")
 
-        provider = GeminiProvider(api_key="test-key")
         context = {
             "scene_objects": ["Cube", "Camera"],
             "active_object": "Cube",
@@ -157,19 +183,15 @@ class TestGeminiProviderGenerateCode:
 class TestGeminiProviderFixCode:
     """Tests for code fixing."""
 
-    @patch("src.ai.gemini_provider.genai")
     @pytest.mark.asyncio
-    async def test_fix_code_success(self, mock_genai: MagicMock) -> None:
+    async def test_fix_code_success(
+        self, provider: GeminiProvider, mock_model: MagicMock
+    ) -> None:
         """Test successful code fixing."""
-        mock_response = MagicMock()
-        mock_response.text = "import bpy\ncube = bpy.data.objects.get('Cube')"
-        mock_response.usage_metadata = None
-
-        mock_model = MagicMock()
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
-        mock_genai.GenerativeModel.return_value = mock_model
+        mock_model.generate_content_async.return_value = _response(
+            "import bpy\ncube = bpy.data.objects.get('Cube')"
+        )
 
-        provider = GeminiProvider(api_key="test-key")
         result = await provider.fix_code(
             code="cube = bpy.data.objects['Cube']",
             error="KeyError: 'Cube'",
@@ -183,33 +205,24 @@ class TestGeminiProviderFixCode:
 class TestGeminiProviderValidation:
     """Tests for connection validation."""
 
-    @patch("src.ai.gemini_provider.genai")
     @pytest.mark.asyncio
-    async def test_validate_connection_success(self, mock_genai: MagicMock) -> None:
+    async def test_validate_connection_success(
+        self, provider: GeminiProvider, mock_model: MagicMock
+    ) -> None:
         """Test successful connection validation."""
-        mock_response = MagicMock()
-        mock_response.text = "ok"
-
-        mock_model = MagicMock()
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
-        mock_genai.GenerativeModel.return_value = mock_model
+        mock_model.generate_content_async.return_value = _response("ok")
 
-        provider = GeminiProvider(api_key="test-key")
         result = await provider.validate_connection()
 
         assert result is True
 
-    @patch("src.ai.gemini_provider.genai")
     @pytest.mark.asyncio
-    async def test_validate_connection_failure(self, mock_genai: MagicMock) -> None:
+    async def test_validate_connection_failure(
+        self, provider: GeminiProvider, mock_model: MagicMock
+    ) -> None:
         """Test connection validation failure."""
-        mock_model = MagicMock()
-        mock_model.generate_content_async = AsyncMock(
-            side_effect=Exception("Connection failed")
-        )
-        mock_genai.GenerativeModel.return_value = mock_model
+        mock_model.generate_content_async.side_effect = Exception("Connection failed")
 
-        provider = GeminiProvider(api_key="test-key")
         result = await provider.validate_connection()
 
         assert result is False
@@ -5,10 +5,12 @@ Tests for ChatInput, ChatTextEdit, MessageList, and ChatPanel classes.
 """
 
 from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtTest import QSignalSpy
 from PyQt6.QtWidgets import QLabel, QPushButton, QTextEdit
 
 from src.gui.chat_panel import ChatInput, ChatPanel, ChatTextEdit, MessageList
@@ -41,34 +43,44 @@ def signals() -> AetherSignals:
 
 
 @pytest.fixture
-def sample_user_message() -> ChatMessage:
-    """Create a sample user message."""
-    return ChatMessage(
-        role=MessageRole.USER,
-        content="Create a cube",
-        timestamp=datetime(2024, 1, 15, 10, 30, 0),
+def chat_input_parts(qtbot, signals: AetherSignals) -> SimpleNamespace:
+    """Create a ChatInput and look up its text field and send button once."""
+    chat_input = ChatInput(signals)
+    qtbot.addWidget(chat_input)
+    return SimpleNamespace(
+        widget=chat_input,
+        text=chat_input.findChild(ChatTextEdit),
+        send=chat_input.findChild(QPushButton, "sendButton"),
     )
 
 
-@pytest.fixture
-def sample_assistant_message() -> ChatMessage:
-    """Create a sample assistant message."""
-    return ChatMessage(
-        role=MessageRole.ASSISTANT,
-        content="Creating a cube for you...",
-        timestamp=datetime(2024, 1, 15, 10, 30, 5),
-        code="import bpy\nbpy.ops.mesh.primitive_cube_add()",
-    )
+# Timestamps are never asserted on, so every test message shares one
+SAMPLE_TIMESTAMP = datetime(2024, 1, 15, 10, 30, 0)
 
+# Content long enough to wrap many times, built once at import
+LONG_CONTENT = "A" * 10000
 
-@pytest.fixture
-def sample_system_message() -> ChatMessage:
-    """Create a sample system message."""
-    return ChatMessage(
-        role=MessageRole.SYSTEM,
-        content="Connected to Blender",
-        timestamp=datetime(2024, 1, 15, 10, 29, 0),
-    )
+# Shared sample messages; nothing in these tests mutates a ChatMessage
+SAMPLE_USER_MESSAGE = ChatMessage(
+    role=MessageRole.USER,
+    content="Create a cube",
+    timestamp=SAMPLE_TIMESTAMP,
+)
+
+SAMPLE_ASSISTANT_MESSAGE = ChatMessage(
+    role=MessageRole.ASSISTANT,
+    content="Creating a cube for you...",
+    timestamp=datetime(2024, 1, 15, 10, 30, 5),
+    code="import bpy\nbpy.ops.mesh.primitive_cube_add()",
+)
+
+# Key events for the Enter handling tests; each is delivered by one test only
+ENTER_EVENT = QKeyEvent(
+    QKeyEvent.Type.KeyPress, Qt.Key.Key_Return, Qt.KeyboardModifier.NoModifier
+)
+SHIFT_ENTER_EVENT = QKeyEvent(
+    QKeyEvent.Type.KeyPress, Qt.Key.Key_Return, Qt.KeyboardModifier.ShiftModifier
+)
 
 
 # ============================================================================
@@ -91,14 +103,10 @@ class TestChatTextEdit:
         qtbot.addWidget(text_edit)
         text_edit.setPlainText("Hello")
 
-        with qtbot.waitSignal(text_edit.enter_pressed, timeout=1000):
-            # Create Enter key event
-            event = QKeyEvent(
-                QKeyEvent.Type.KeyPress,
-                Qt.Key.Key_Return,
-                Qt.KeyboardModifier.NoModifier,
-            )
-            text_edit.keyPressEvent(event)
+        spy = QSignalSpy(text_edit.enter_pressed)
+        text_edit.keyPressEvent(ENTER_EVENT)
+
+        assert len(spy) == 1
 
     def test_shift_enter_does_not_emit_signal(self, qtbot) -> None:
         """Test Shift+Enter does not emit enter_pressed signal."""
@@ -114,13 +122,7 @@ class TestChatTextEdit:
 
         text_edit.enter_pressed.connect(on_enter)
 
-        # Create Shift+Enter key event
-        event = QKeyEvent(
-            QKeyEvent.Type.KeyPress,
-            Qt.Key.Key_Return,
-            Qt.KeyboardModifier.ShiftModifier,
-        )
-        text_edit.keyPressEvent(event)
+        text_edit.keyPressEvent(SHIFT_ENTER_EVENT)
 
         assert not signal_emitted
 
@@ -175,130 +177,74 @@ class TestChatInput:
         assert send_btn is not None
         assert send_btn.text() == "Send"
 
-    def test_send_emits_signal(self, qtbot, signals: AetherSignals) -> None:
+    def test_send_emits_signal(
+        self, qtbot, signals: AetherSignals, chat_input_parts: SimpleNamespace
+    ) -> None:
         """Test clicking send emits user_message_submitted signal."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
+        chat_input_parts.text.setPlainText("Hello AI")
 
-        # Type message
-        text_edit = chat_input.findChild(ChatTextEdit)
-        text_edit.setPlainText("Hello AI")
-
-        with qtbot.waitSignal(signals.user_message_submitted, timeout=1000) as blocker:
-            send_btn = chat_input.findChild(QPushButton, "sendButton")
-            send_btn.click()
+        spy = QSignalSpy(signals.user_message_submitted)
+        chat_input_parts.send.click()
 
-        assert blocker.args == ["Hello AI"]
+        assert spy[0] == ["Hello AI"]
 
-    def test_send_clears_input(self, qtbot, signals: AetherSignals) -> None:
+    def test_send_clears_input(self, chat_input_parts: SimpleNamespace) -> None:
         """Test sending a message clears the input field."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-
-        text_edit = chat_input.findChild(ChatTextEdit)
-        text_edit.setPlainText("Hello")
+        chat_input_parts.text.setPlainText("Hello")
 
-        send_btn = chat_input.findChild(QPushButton, "sendButton")
-        send_btn.click()
+        chat_input_parts.send.click()
 
-        assert text_edit.toPlainText() == ""
+        assert chat_input_parts.text.toPlainText() == ""
 
-    def test_empty_message_not_sent(self, qtbot, signals: AetherSignals) -> None:
+    def test_empty_message_not_sent(
+        self, qtbot, signals: AetherSignals, chat_input_parts: SimpleNamespace
+    ) -> None:
         """Test empty message is not sent."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-
-        signal_received = []
-        signals.user_message_submitted.connect(lambda m: signal_received.append(m))
-
         # Click send with empty input
-        send_btn = chat_input.findChild(QPushButton, "sendButton")
-        send_btn.click()
-
-        assert len(signal_received) == 0
+        with qtbot.assertNotEmitted(signals.user_message_submitted):
+            chat_input_parts.send.click()
 
-    def test_whitespace_only_not_sent(self, qtbot, signals: AetherSignals) -> None:
+    def test_whitespace_only_not_sent(
+        self, qtbot, signals: AetherSignals, chat_input_parts: SimpleNamespace
+    ) -> None:
         """Test whitespace-only message is not sent."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-
-        signal_received = []
-        signals.user_message_submitted.connect(lambda m: signal_received.append(m))
-
-        text_edit = chat_input.findChild(ChatTextEdit)
-        text_edit.setPlainText("   \n\t   ")
-
-        send_btn = chat_input.findChild(QPushButton, "sendButton")
-        send_btn.click()
+        chat_input_parts.text.setPlainText("   \n\t   ")
 
-        assert len(signal_received) == 0
+        with qtbot.assertNotEmitted(signals.user_message_submitted):
+            chat_input_parts.send.click()
 
-    def test_processing_disables_input(self, qtbot, signals: AetherSignals) -> None:
-        """Test processing_started disables input."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
+    def test_processing_state_cycle(
+        self, qtbot, signals: AetherSignals, chat_input_parts: SimpleNamespace
+    ) -> None:
+        """Test processing disables input and blocks sending until finished."""
+        text_edit = chat_input_parts.text
+        send_btn = chat_input_parts.send
+        text_edit.setPlainText("Test message")
 
         signals.processing_started.emit()
 
-        text_edit = chat_input.findChild(ChatTextEdit)
-        send_btn = chat_input.findChild(QPushButton, "sendButton")
-
         assert not text_edit.isEnabled()
         assert not send_btn.isEnabled()
+        with qtbot.assertNotEmitted(signals.user_message_submitted):
+            send_btn.click()
 
-    def test_processing_finished_enables_input(
-        self, qtbot, signals: AetherSignals
-    ) -> None:
-        """Test processing_finished re-enables input."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-
-        signals.processing_started.emit()
         signals.processing_finished.emit()
 
-        text_edit = chat_input.findChild(ChatTextEdit)
-        send_btn = chat_input.findChild(QPushButton, "sendButton")
-
         assert text_edit.isEnabled()
         assert send_btn.isEnabled()
 
-    def test_cannot_send_during_processing(self, qtbot, signals: AetherSignals) -> None:
-        """Test cannot send message during processing."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-
-        text_edit = chat_input.findChild(ChatTextEdit)
-        text_edit.setPlainText("Test message")
-
-        signals.processing_started.emit()
-
-        signal_received = []
-        signals.user_message_submitted.connect(lambda m: signal_received.append(m))
-
-        send_btn = chat_input.findChild(QPushButton, "sendButton")
-        send_btn.click()
-
-        assert len(signal_received) == 0
-
-    def test_set_focus(self, qtbot, signals: AetherSignals) -> None:
+    def test_set_focus(self, chat_input_parts: SimpleNamespace) -> None:
         """Test set_focus method."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-        chat_input.show()
+        chat_input_parts.widget.show()
 
-        chat_input.set_focus()
+        chat_input_parts.widget.set_focus()
 
-        text_edit = chat_input.findChild(ChatTextEdit)
         # Focus is set (widget may need to be visible for actual focus)
-        assert text_edit is not None
+        assert chat_input_parts.text is not None
 
-    def test_placeholder_text(self, qtbot, signals: AetherSignals) -> None:
+    def test_placeholder_text(self, chat_input_parts: SimpleNamespace) -> None:
         """Test input field has placeholder text."""
-        chat_input = ChatInput(signals)
-        qtbot.addWidget(chat_input)
-
-        text_edit = chat_input.findChild(ChatTextEdit)
-        placeholder = text_edit.placeholderText()
+        placeholder = chat_input_parts.text.placeholderText()
         assert "Enter" in placeholder
         assert "send" in placeholder.lower()
 
@@ -319,72 +265,74 @@ class TestMessageList:
         assert message_list is not None
         assert message_list.messages == []
 
-    def test_message_added_via_signal(
-        self, qtbot, signals: AetherSignals, sample_user_message: ChatMessage
-    ) -> None:
+    def test_message_added_via_signal(self, qtbot, signals: AetherSignals) -> None:
         """Test message is added when signal received."""
         message_list = MessageList(signals)
         qtbot.addWidget(message_list)
 
-        signals.message_received.emit(sample_user_message)
+        signals.message_received.emit(SAMPLE_USER_MESSAGE)
 
         assert len(message_list.messages) == 1
-        assert message_list.messages[0] == sample_user_message
+        assert message_list.messages[0] == SAMPLE_USER_MESSAGE
 
     def test_multiple_messages_added(
         self,
         qtbot,
         signals: AetherSignals,
-        sample_user_message: ChatMessage,
-        sample_assistant_message: ChatMessage,
     ) -> None:
         """Test multiple messages can be added."""
         message_list = MessageList(signals)
         qtbot.addWidget(message_list)
 
-        signals.message_received.emit(sample_user_message)
-        signals.message_received.emit(sample_assistant_message)
+        signals.message_received.emit(SAMPLE_USER_MESSAGE)
+        signals.message_received.emit(SAMPLE_ASSISTANT_MESSAGE)
 
         assert len(message_list.messages) == 2
-        assert message_list.messages[0] == sample_user_message
-        assert message_list.messages[1] == sample_assistant_message
+        assert message_list.messages[0] == SAMPLE_USER_MESSAGE
+        assert message_list.messages[1] == SAMPLE_ASSISTANT_MESSAGE
 
-    def test_clear_removes_messages(
-        self, qtbot, signals: AetherSignals, sample_user_message: ChatMessage
-    ) -> None:
+    def test_clear_removes_messages(self, qtbot, signals: AetherSignals) -> None:
         """Test chat_cleared removes all messages."""
         message_list = MessageList(signals)
         qtbot.addWidget(message_list)
 
-        signals.message_received.emit(sample_user_message)
+        signals.message_received.emit(SAMPLE_USER_MESSAGE)
         assert len(message_list.messages) == 1
 
         signals.chat_cleared.emit()
         assert len(message_list.messages) == 0
 
-    def test_message_container_created(
-        self, qtbot, signals: AetherSignals, sample_user_message: ChatMessage
-    ) -> None:
+    def test_message_container_created(self, qtbot, signals: AetherSignals) -> None:
         """Test MessageContainer widget is created for each message."""
         message_list = MessageList(signals)
         qtbot.addWidget(message_list)
 
-        signals.message_received.emit(sample_user_message)
+        signals.message_received.emit(SAMPLE_USER_MESSAGE)
 
         containers = message_list.findChildren(MessageContainer)
         assert len(containers) == 1
 
+    def test_add_messages_in_one_batch(self, qtbot, signals: AetherSignals) -> None:
+        """Test add_messages appends every message and its container in order."""
+        message_list = MessageList(signals)
+        qtbot.addWidget(message_list)
+
+        message_list.add_messages([SAMPLE_USER_MESSAGE, SAMPLE_ASSISTANT_MESSAGE])
+
+        assert message_list.messages == [SAMPLE_USER_MESSAGE, SAMPLE_ASSISTANT_MESSAGE]
+        assert len(message_list.findChildren(MessageContainer)) == 2
+
     def test_messages_property_returns_copy(
-        self, qtbot, signals: AetherSignals, sample_user_message: ChatMessage
+        self, qtbot, signals: AetherSignals
     ) -> None:
         """Test messages property returns a copy, not the original list."""
         message_list = MessageList(signals)
         qtbot.addWidget(message_list)
 
-        signals.message_received.emit(sample_user_message)
+        signals.message_received.emit(SAMPLE_USER_MESSAGE)
 
         messages = message_list.messages
-        messages.append(sample_user_message)  # Modify the returned list
+        messages.append(SAMPLE_USER_MESSAGE)  # Modify the returned list
 
         # Original should be unchanged
         assert len(message_list.messages) == 1
@@ -393,7 +341,6 @@ class TestMessageList:
         self,
         qtbot,
         signals: AetherSignals,
-        sample_assistant_message: ChatMessage,
     ) -> None:
         """Test code copy requests are handled."""
         message_list = MessageList(signals)
@@ -409,7 +356,7 @@ class TestMessageList:
             )
         )
 
-        signals.message_received.emit(sample_assistant_message)
+        signals.message_received.emit(SAMPLE_ASSISTANT_MESSAGE)
 
         # Find the code block and trigger copy
         containers = message_list.findChildren(MessageContainer)
@@ -438,39 +385,17 @@ class TestChatPanel:
 
         assert panel is not None
 
-    def test_chat_panel_has_message_list(self, qtbot, signals: AetherSignals) -> None:
-        """Test ChatPanel contains MessageList."""
-        panel = ChatPanel(signals)
-        qtbot.addWidget(panel)
-
-        message_list = panel.findChild(MessageList)
-        assert message_list is not None
-
-    def test_chat_panel_has_input(self, qtbot, signals: AetherSignals) -> None:
-        """Test ChatPanel contains ChatInput."""
-        panel = ChatPanel(signals)
-        qtbot.addWidget(panel)
-
-        chat_input = panel.findChild(ChatInput)
-        assert chat_input is not None
-
-    def test_chat_panel_has_header(self, qtbot, signals: AetherSignals) -> None:
-        """Test ChatPanel has a header with title."""
-        panel = ChatPanel(signals)
-        qtbot.addWidget(panel)
-
-        labels = panel.findChildren(QLabel)
-        chat_labels = [lbl for lbl in labels if "Chat" in lbl.text()]
-        assert len(chat_labels) >= 1
-
-    def test_chat_panel_has_clear_button(self, qtbot, signals: AetherSignals) -> None:
-        """Test ChatPanel has a clear button."""
+    def test_chat_panel_has_expected_children(
+        self, qtbot, signals: AetherSignals
+    ) -> None:
+        """Test ChatPanel contains its message list, input, header and clear button."""
         panel = ChatPanel(signals)
         qtbot.addWidget(panel)
 
-        buttons = panel.findChildren(QPushButton)
-        clear_buttons = [b for b in buttons if b.text() == "Clear"]
-        assert len(clear_buttons) >= 1
+        assert panel.findChild(MessageList) is not None
+        assert panel.findChild(ChatInput) is not None
+        assert any("Chat" in lbl.text() for lbl in panel.findChildren(QLabel))
+        assert any(b.text() == "Clear" for b in panel.findChildren(QPushButton))
 
     def test_welcome_message_added(self, qtbot, signals: AetherSignals) -> None:
         """Test welcome message is added on creation."""
@@ -556,7 +481,7 @@ class TestChatPanelIntegration:
         assistant_msg = ChatMessage(
             role=MessageRole.ASSISTANT,
             content="Creating a cube...",
-            timestamp=datetime.now(),
+            timestamp=SAMPLE_TIMESTAMP,
             code="bpy.ops.mesh.primitive_cube_add()",
         )
         signals.message_received.emit(assistant_msg)
@@ -567,7 +492,7 @@ class TestChatPanelIntegration:
         system_msg = ChatMessage(
             role=MessageRole.SYSTEM,
             content="Cube created successfully",
-            timestamp=datetime.now(),
+            timestamp=SAMPLE_TIMESTAMP,
         )
         signals.message_received.emit(system_msg)
         assert len(panel.messages) == 4
@@ -601,7 +526,7 @@ class TestChatPanelIntegration:
         error_msg = ChatMessage(
             role=MessageRole.ERROR,
             content="Execution failed: syntax error",
-            timestamp=datetime.now(),
+            timestamp=SAMPLE_TIMESTAMP,
         )
         signals.message_received.emit(error_msg)
 
@@ -625,7 +550,7 @@ class TestChatPanelIntegration:
                 ChatMessage(
                     role=MessageRole.ASSISTANT,
                     content=f"Assistant response {i}",
-                    timestamp=datetime.now(),
+                    timestamp=SAMPLE_TIMESTAMP,
                 )
             )
 
@@ -641,37 +566,25 @@ class TestChatPanelIntegration:
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    def test_very_long_message(self, qtbot, signals: AetherSignals) -> None:
-        """Test handling very long messages."""
-        panel = ChatPanel(signals)
-        qtbot.addWidget(panel)
-
-        long_message = "A" * 10000
-        signals.user_message_submitted.emit(long_message)
-
-        assert panel.messages[1].content == long_message
-
-    def test_message_with_special_characters(
-        self, qtbot, signals: AetherSignals
+    @pytest.mark.parametrize(
+        "content",
+        [
+            LONG_CONTENT,
+            "<script>alert('xss')</script> & \"quotes\"",
+            "Hello 🌍 World 你好 مرحبا",
+        ],
+        ids=["long", "special_characters", "unicode"],
+    )
+    def test_message_content_preserved(
+        self, qtbot, signals: AetherSignals, content: str
     ) -> None:
-        """Test handling messages with special characters."""
+        """Test unusual message text reaches the panel unchanged."""
         panel = ChatPanel(signals)
         qtbot.addWidget(panel)
 
-        special = "<script>alert('xss')</script> & \"quotes\""
-        signals.user_message_submitted.emit(special)
+        signals.user_message_submitted.emit(content)
 
-        assert panel.messages[1].content == special
-
-    def test_message_with_unicode(self, qtbot, signals: AetherSignals) -> None:
-        """Test handling messages with unicode."""
-        panel = ChatPanel(signals)
-        qtbot.addWidget(panel)
-
-        unicode_msg = "Hello 🌍 World 你好 مرحبا"
-        signals.user_message_submitted.emit(unicode_msg)
-
-        assert panel.messages[1].content == unicode_msg
+        assert panel.messages[1].content == content
 
     def test_rapid_message_sending(self, qtbot, signals: AetherSignals) -> None:
         """Test rapid message sending."""
@@ -685,6 +598,24 @@ class TestEdgeCases:
         # 1 welcome + 20 user = 21
         assert len(panel.messages) == 21
 
+    def test_append_many_messages(self, qtbot, signals: AetherSignals) -> None:
+        """Test appending a large batch of messages directly."""
+        panel = ChatPanel(signals)
+        qtbot.addWidget(panel)
+
+        panel.append_messages(
+            ChatMessage(
+                role=MessageRole.USER,
+                content=f"Message {i}",
+                timestamp=SAMPLE_TIMESTAMP,
+            )
+            for i in range(20)
+        )
+
+        # 1 welcome + 20 user = 21
+        assert len(panel.messages) == 21
+        assert panel.messages[-1].content == "Message 19"
+
     def test_clear_then_continue(self, qtbot, signals: AetherSignals) -> None:
         """Test clearing and continuing conversation."""
         panel = ChatPanel(signals)
@@ -701,7 +632,7 @@ class TestEdgeCases:
             ChatMessage(
                 role=MessageRole.SYSTEM,
                 content="Welcome back!",
-                timestamp=datetime.now(),
+                timestamp=SAMPLE_TIMESTAMP,
             )
         )
 
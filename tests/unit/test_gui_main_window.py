@@ -4,9 +4,8 @@ Unit Tests for GUI Main Window Module.
 Tests for MainWindow class and run_app function.
 """
 
-from unittest.mock import patch
-
 import pytest
+from PyQt6.QtTest import QSignalSpy
 
 from src.gui.chat_panel import ChatPanel
 from src.gui.main_window import MainWindow
@@ -104,49 +103,15 @@ class TestMainWindow:
 class TestMainWindowMenus:
     """Tests for MainWindow menu functionality."""
 
-    def test_file_menu_exists(self, qtbot, signals: AetherSignals) -> None:
-        """Test File menu exists."""
-        window = MainWindow(signals)
-        qtbot.addWidget(window)
-
-        menu_bar = window.menuBar()
-        actions = menu_bar.actions()
-        menu_titles = [a.text() for a in actions]
-
-        assert any("File" in t for t in menu_titles)
-
-    def test_edit_menu_exists(self, qtbot, signals: AetherSignals) -> None:
-        """Test Edit menu exists."""
-        window = MainWindow(signals)
-        qtbot.addWidget(window)
-
-        menu_bar = window.menuBar()
-        actions = menu_bar.actions()
-        menu_titles = [a.text() for a in actions]
-
-        assert any("Edit" in t for t in menu_titles)
-
-    def test_settings_menu_exists(self, qtbot, signals: AetherSignals) -> None:
-        """Test Settings menu exists."""
-        window = MainWindow(signals)
-        qtbot.addWidget(window)
-
-        menu_bar = window.menuBar()
-        actions = menu_bar.actions()
-        menu_titles = [a.text() for a in actions]
-
-        assert any("Settings" in t for t in menu_titles)
-
-    def test_help_menu_exists(self, qtbot, signals: AetherSignals) -> None:
-        """Test Help menu exists."""
+    @pytest.mark.parametrize("menu_name", ["File", "Edit", "Settings", "Help"])
+    def test_menu_exists(self, qtbot, signals: AetherSignals, menu_name: str) -> None:
+        """Test each top-level menu exists."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        menu_bar = window.menuBar()
-        actions = menu_bar.actions()
-        menu_titles = [a.text() for a in actions]
+        menu_titles = [a.text() for a in window.menuBar().actions()]
 
-        assert any("Help" in t for t in menu_titles)
+        assert any(menu_name in t for t in menu_titles)
 
 
 # ============================================================================
@@ -157,66 +122,38 @@ class TestMainWindowMenus:
 class TestMainWindowActions:
     """Tests for MainWindow action handlers."""
 
-    def test_new_chat_emits_signal(self, qtbot, signals: AetherSignals) -> None:
-        """Test new chat action emits chat_cleared signal."""
+    @pytest.mark.parametrize(
+        ("handler", "signal_name"),
+        [
+            pytest.param("_on_new_chat", "chat_cleared", id="new_chat"),
+            pytest.param("_on_connect", "connection_requested", id="connect"),
+            pytest.param("_on_disconnect", "disconnection_requested", id="disconnect"),
+            pytest.param("_on_clear_chat", "chat_cleared", id="clear_chat"),
+        ],
+    )
+    def test_action_emits_signal(
+        self, qtbot, signals: AetherSignals, handler: str, signal_name: str
+    ) -> None:
+        """Test each menu action handler emits its signal exactly once."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        signal_received = []
-        signals.chat_cleared.connect(lambda: signal_received.append(True))
-
-        window._on_new_chat()
+        spy = QSignalSpy(getattr(signals, signal_name))
 
-        assert len(signal_received) == 1
+        getattr(window, handler)()
 
-    def test_connect_emits_signal(self, qtbot, signals: AetherSignals) -> None:
-        """Test connect action emits connection_requested signal."""
-        window = MainWindow(signals)
-        qtbot.addWidget(window)
-
-        signal_received = []
-        signals.connection_requested.connect(lambda: signal_received.append(True))
-
-        window._on_connect()
-
-        assert len(signal_received) == 1
-
-    def test_disconnect_emits_signal(self, qtbot, signals: AetherSignals) -> None:
-        """Test disconnect action emits disconnection_requested signal."""
-        window = MainWindow(signals)
-        qtbot.addWidget(window)
-
-        signal_received = []
-        signals.disconnection_requested.connect(lambda: signal_received.append(True))
-
-        window._on_disconnect()
-
-        assert len(signal_received) == 1
-
-    def test_clear_chat_emits_signal(self, qtbot, signals: AetherSignals) -> None:
-        """Test clear chat action emits chat_cleared signal."""
-        window = MainWindow(signals)
-        qtbot.addWidget(window)
-
-        signal_received = []
-        signals.chat_cleared.connect(lambda: signal_received.append(True))
-
-        window._on_clear_chat()
-
-        assert len(signal_received) == 1
+        assert len(spy) == 1
 
     def test_about_shows_info(self, qtbot, signals: AetherSignals) -> None:
         """Test about action shows info toast."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        info_received = []
-        signals.toast_requested.connect(
-            lambda n: info_received.append(n.message) if "Aether" in n.message else None
-        )
+        spy = QSignalSpy(signals.toast_requested)
 
         window._on_about()
 
+        info_received = [args[0].message for args in spy if "Aether" in args[0].message]
         assert len(info_received) >= 1
         assert "0.1.0" in info_received[0]
 
@@ -225,13 +162,10 @@ class TestMainWindowActions:
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        error_received = []
-        signals.toast_requested.connect(lambda n: error_received.append(n.message))
-
+        spy = QSignalSpy(signals.toast_requested)
         window._on_error("Test error message")
 
-        assert len(error_received) >= 1
-        assert "Test error message" in error_received[0]
+        assert "Test error message" in spy[0][0].message
 
 
 # ============================================================================
@@ -262,13 +196,10 @@ class TestMainWindowSignals:
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        error_received = []
-        signals.toast_requested.connect(lambda n: error_received.append(n.message))
-
+        spy = QSignalSpy(signals.toast_requested)
         signals.error_occurred.emit("Something went wrong")
 
-        assert len(error_received) >= 1
-        assert "Something went wrong" in error_received[0]
+        assert "Something went wrong" in spy[0][0].message
 
 
 # ============================================================================
@@ -293,12 +224,8 @@ class TestMainWindowLifecycle:
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        ready_received = []
-        signals.app_ready.connect(lambda: ready_received.append(True))
-
-        window.show()
-
-        assert len(ready_received) >= 1
+        with qtbot.waitSignal(signals.app_ready, timeout=1000):
+            window.show()
 
     def test_show_event_sets_focus(self, qtbot, signals: AetherSignals) -> None:
         """Test show event sets focus to chat panel."""
@@ -323,27 +250,27 @@ class TestMainWindowIntegration:
         """Test complete application workflow."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
-        window.show()
 
         # Verify all components present
-        assert window.findChild(ChatPanel) is not None
-        assert window.findChild(AetherStatusBar) is not None
+        assert isinstance(window.chat_panel, ChatPanel)
+        assert isinstance(window.status_bar, AetherStatusBar)
         assert window.menuBar() is not None
 
         # Verify signals work
-        clear_received = []
-        signals.chat_cleared.connect(lambda: clear_received.append(True))
+        spy = QSignalSpy(signals.chat_cleared)
         window._on_new_chat()
-        assert len(clear_received) == 1
+        assert len(spy) == 1
 
-    def test_settings_dialog_opens(self, qtbot, signals: AetherSignals) -> None:
+    def test_settings_dialog_opens(
+        self, qtbot, signals: AetherSignals, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test settings dialog can be opened."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
 
-        # Mock dialog exec to avoid blocking
-        with patch.object(SettingsDialog, "exec", return_value=0):
-            window._on_open_settings()
+        # Stub dialog exec to avoid blocking
+        monkeypatch.setattr(SettingsDialog, "exec", lambda _self: 0)
+        window._on_open_settings()
 
         # Should not crash
 
@@ -351,7 +278,6 @@ class TestMainWindowIntegration:
         """Test menu actions are functional."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
-        window.show()
 
         # Get menu bar
         menu_bar = window.menuBar()
@@ -387,7 +313,6 @@ class TestEdgeCases:
         """Test rapid signal emissions don't cause issues."""
         window = MainWindow(signals)
         qtbot.addWidget(window)
-        window.show()
 
         # Rapidly emit signals
         for _ in range(50):
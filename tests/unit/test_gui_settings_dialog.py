@@ -4,6 +4,8 @@ Unit Tests for GUI Settings Dialog Module.
 Tests for SettingsDialog class and provider/model configuration.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from PyQt6.QtWidgets import QComboBox, QGroupBox, QLineEdit, QPushButton
 
@@ -34,6 +36,20 @@ def signals() -> AetherSignals:
     return get_signals()
 
 
+@pytest.fixture
+def dialog_parts(qtbot, signals: AetherSignals) -> SimpleNamespace:
+    """Create a SettingsDialog and collect its child widgets once."""
+    dialog = SettingsDialog(signals)
+    qtbot.addWidget(dialog)
+    return SimpleNamespace(
+        widget=dialog,
+        groups=dialog.findChildren(QGroupBox),
+        combos=dialog.findChildren(QComboBox),
+        line_edits=dialog.findChildren(QLineEdit),
+        buttons=dialog.findChildren(QPushButton),
+    )
+
+
 # ============================================================================
 # TestSettingsDialogCreation
 # ============================================================================
@@ -93,91 +109,61 @@ class TestSettingsDialogCreation:
 class TestSettingsDialogUI:
     """Tests for SettingsDialog UI components."""
 
-    def test_has_ai_provider_section(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_ai_provider_section(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has AI Provider section."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        groups = dialog.findChildren(QGroupBox)
+        groups = dialog_parts.groups
         ai_groups = [g for g in groups if "AI" in g.title()]
         assert len(ai_groups) >= 1
 
-    def test_has_connection_section(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_connection_section(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has Connection section."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        groups = dialog.findChildren(QGroupBox)
+        groups = dialog_parts.groups
         conn_groups = [g for g in groups if "Connection" in g.title()]
         assert len(conn_groups) >= 1
 
-    def test_has_provider_combo(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_provider_combo(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has provider combobox."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         assert len(combos) >= 1
 
-    def test_has_model_combo(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_model_combo(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has model combobox."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         assert len(combos) >= 2  # Provider and Model
 
-    def test_has_api_key_input(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_api_key_input(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has API key input."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        line_edits = dialog.findChildren(QLineEdit)
+        line_edits = dialog_parts.line_edits
         # Should have API key, host, and port inputs
         assert len(line_edits) >= 3
 
-    def test_has_host_input(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_host_input(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has host input with default value."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        line_edits = dialog.findChildren(QLineEdit)
+        line_edits = dialog_parts.line_edits
         host_inputs = [le for le in line_edits if le.text() == "localhost"]
         assert len(host_inputs) >= 1
 
-    def test_has_port_input(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_port_input(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has port input with default value."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        line_edits = dialog.findChildren(QLineEdit)
+        line_edits = dialog_parts.line_edits
         port_inputs = [le for le in line_edits if le.text() == "5005"]
         assert len(port_inputs) >= 1
 
-    def test_has_save_button(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_save_button(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has save button."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_buttons = [b for b in buttons if b.text() == "Save"]
         assert len(save_buttons) >= 1
 
-    def test_has_cancel_button(self, qtbot, signals: AetherSignals) -> None:
+    def test_has_cancel_button(self, dialog_parts: SimpleNamespace) -> None:
         """Test dialog has cancel button."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         cancel_buttons = [b for b in buttons if b.text() == "Cancel"]
         assert len(cancel_buttons) >= 1
 
-    def test_api_key_password_mode(self, qtbot, signals: AetherSignals) -> None:
+    def test_api_key_password_mode(self, dialog_parts: SimpleNamespace) -> None:
         """Test API key input is in password mode."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        line_edits = dialog.findChildren(QLineEdit)
+        line_edits = dialog_parts.line_edits
         password_inputs = [
             le for le in line_edits if le.echoMode() == QLineEdit.EchoMode.Password
         ]
@@ -192,12 +178,9 @@ class TestSettingsDialogUI:
 class TestProviderModels:
     """Tests for provider and model configuration."""
 
-    def test_all_providers_in_combo(self, qtbot, signals: AetherSignals) -> None:
+    def test_all_providers_in_combo(self, dialog_parts: SimpleNamespace) -> None:
         """Test all providers are available in combobox."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         provider_combo = combos[0]  # First combo is provider
 
         items = [provider_combo.itemData(i) for i in range(provider_combo.count())]
@@ -205,13 +188,10 @@ class TestProviderModels:
             assert provider in items
 
     def test_provider_change_updates_models(
-        self, qtbot, signals: AetherSignals
+        self, dialog_parts: SimpleNamespace
     ) -> None:
         """Test changing provider updates model dropdown."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         provider_combo = combos[0]
         model_combo = combos[1]
 
@@ -224,26 +204,22 @@ class TestProviderModels:
         for model in PROVIDER_MODELS["openai"]:
             assert model in model_items
 
-    def test_set_provider_method(self, qtbot, signals: AetherSignals) -> None:
+    def test_set_provider_method(self, dialog_parts: SimpleNamespace) -> None:
         """Test set_provider method sets correct provider and model."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
+        dialog = dialog_parts.widget
 
         dialog.set_provider("anthropic", "claude-3-opus-20240229")
 
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         provider_combo = combos[0]
         model_combo = combos[1]
 
         assert provider_combo.currentData() == "anthropic"
         assert model_combo.currentData() == "claude-3-opus-20240229"
 
-    def test_default_model_selected(self, qtbot, signals: AetherSignals) -> None:
+    def test_default_model_selected(self, dialog_parts: SimpleNamespace) -> None:
         """Test default model is selected when provider changes."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         provider_combo = combos[0]
         model_combo = combos[1]
 
@@ -263,11 +239,10 @@ class TestProviderModels:
 class TestSettingsDialogActions:
     """Tests for SettingsDialog actions."""
 
-    def test_save_emits_signals(self, qtbot, signals: AetherSignals) -> None:
+    def test_save_emits_signals(
+        self, dialog_parts: SimpleNamespace, signals: AetherSignals
+    ) -> None:
         """Test save button emits settings_changed and provider_changed signals."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
         settings_received = []
         provider_received = []
 
@@ -275,23 +250,22 @@ class TestSettingsDialogActions:
         signals.provider_changed.connect(lambda p, m: provider_received.append((p, m)))
 
         # Click save
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_btn = next(b for b in buttons if b.text() == "Save")
         save_btn.click()
 
         assert len(settings_received) == 1
         assert len(provider_received) == 1
 
-    def test_save_settings_content(self, qtbot, signals: AetherSignals) -> None:
+    def test_save_settings_content(
+        self, dialog_parts: SimpleNamespace, signals: AetherSignals
+    ) -> None:
         """Test saved settings contain correct data."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
         settings_received = []
         signals.settings_changed.connect(lambda s: settings_received.append(s))
 
         # Click save
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_btn = next(b for b in buttons if b.text() == "Save")
         save_btn.click()
 
@@ -301,10 +275,11 @@ class TestSettingsDialogActions:
         assert "host" in settings
         assert "port" in settings
 
-    def test_save_with_custom_values(self, qtbot, signals: AetherSignals) -> None:
+    def test_save_with_custom_values(
+        self, dialog_parts: SimpleNamespace, signals: AetherSignals
+    ) -> None:
         """Test save with custom provider and model."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
+        dialog = dialog_parts.widget
 
         # Change provider to openai
         dialog.set_provider("openai", "gpt-4")
@@ -313,38 +288,36 @@ class TestSettingsDialogActions:
         signals.provider_changed.connect(lambda p, m: provider_received.append((p, m)))
 
         # Click save
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_btn = next(b for b in buttons if b.text() == "Save")
         save_btn.click()
 
         assert provider_received[0] == ("openai", "gpt-4")
 
-    def test_cancel_closes_dialog(self, qtbot, signals: AetherSignals) -> None:
+    def test_cancel_closes_dialog(
+        self, dialog_parts: SimpleNamespace, signals: AetherSignals
+    ) -> None:
         """Test cancel button closes dialog without saving."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
         settings_received = []
         signals.settings_changed.connect(lambda s: settings_received.append(s))
 
         # Click cancel
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         cancel_btn = next(b for b in buttons if b.text() == "Cancel")
         cancel_btn.click()
 
         # No settings should be emitted
         assert len(settings_received) == 0
 
-    def test_save_updates_current_provider(self, qtbot, signals: AetherSignals) -> None:
+    def test_save_updates_current_provider(self, dialog_parts: SimpleNamespace) -> None:
         """Test save updates current_provider property."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
+        dialog = dialog_parts.widget
 
         # Change provider
         dialog.set_provider("anthropic", "claude-sonnet-4-20250514")
 
         # Click save
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_btn = next(b for b in buttons if b.text() == "Save")
         save_btn.click()
 
@@ -397,22 +370,16 @@ class TestEdgeCases:
         # Should not crash
         dialog.set_provider("invalid_provider", "invalid_model")
 
-    def test_empty_model_list(self, qtbot, signals: AetherSignals) -> None:
+    def test_empty_model_list(self, dialog_parts: SimpleNamespace) -> None:
         """Test handling of provider with no models (edge case)."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
         # Should handle gracefully even if models list were empty
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         model_combo = combos[1]
         assert model_combo is not None
 
-    def test_rapid_provider_changes(self, qtbot, signals: AetherSignals) -> None:
+    def test_rapid_provider_changes(self, dialog_parts: SimpleNamespace) -> None:
         """Test rapid provider changes don't cause issues."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        combos = dialog.findChildren(QComboBox)
+        combos = dialog_parts.combos
         provider_combo = combos[0]
 
         # Rapidly change providers
@@ -422,37 +389,35 @@ class TestEdgeCases:
 
         # Should not crash
 
-    def test_special_characters_in_host(self, qtbot, signals: AetherSignals) -> None:
+    def test_special_characters_in_host(
+        self, dialog_parts: SimpleNamespace, signals: AetherSignals
+    ) -> None:
         """Test special characters in host input."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        line_edits = dialog.findChildren(QLineEdit)
+        line_edits = dialog_parts.line_edits
         host_input = next(le for le in line_edits if le.text() == "localhost")
         host_input.setText("192.168.1.100")
 
         settings_received = []
         signals.settings_changed.connect(lambda s: settings_received.append(s))
 
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_btn = next(b for b in buttons if b.text() == "Save")
         save_btn.click()
 
         assert settings_received[0]["host"] == "192.168.1.100"
 
-    def test_custom_port(self, qtbot, signals: AetherSignals) -> None:
+    def test_custom_port(
+        self, dialog_parts: SimpleNamespace, signals: AetherSignals
+    ) -> None:
         """Test custom port value."""
-        dialog = SettingsDialog(signals)
-        qtbot.addWidget(dialog)
-
-        line_edits = dialog.findChildren(QLineEdit)
+        line_edits = dialog_parts.line_edits
         port_input = next(le for le in line_edits if le.text() == "5005")
         port_input.setText("9999")
 
         settings_received = []
         signals.settings_changed.connect(lambda s: settings_received.append(s))
 
-        buttons = dialog.findChildren(QPushButton)
+        buttons = dialog_parts.buttons
         save_btn = next(b for b in buttons if b.text() == "Save")
         save_btn.click()
 
@@ -17,6 +17,9 @@ from src.gui.signals import (
     get_signals,
 )
 
+# Fixed timestamp so message construction does not depend on the clock
+SAMPLE_TIMESTAMP = datetime(2024, 1, 15, 10, 30, 0)
+
 
 class TestMessageRole:
     """Test MessageRole enum."""
@@ -70,7 +73,7 @@ class TestChatMessage:
         msg = ChatMessage(
             role=MessageRole.USER,
             content="Hello",
-            timestamp=datetime.now(),
+            timestamp=SAMPLE_TIMESTAMP,
         )
         assert msg.role == MessageRole.USER
         assert msg.content == "Hello"
@@ -82,7 +85,7 @@ class TestChatMessage:
         msg = ChatMessage(
             role=MessageRole.ASSISTANT,
             content="Here's the code:",
-            timestamp=datetime.now(),
+            timestamp=SAMPLE_TIMESTAMP,
             code="import bpy",
         )
         assert msg.code == "import bpy"
@@ -92,7 +95,7 @@ class TestChatMessage:
         msg = ChatMessage(
             role=MessageRole.SYSTEM,
             content="System message",
-            timestamp=datetime.now(),
+            timestamp=SAMPLE_TIMESTAMP,
             metadata={"key": "value"},
         )
         assert msg.metadata == {"key": "value"}
@@ -150,38 +153,38 @@ class TestToastNotification:
 class TestAetherSignals:
     """Test AetherSignals class."""
 
-    def test_signals_creation(self, qtbot: object) -> None:
+    def test_signals_creation(self) -> None:
         """Test signals can be created."""
         signals = AetherSignals()
         assert signals is not None
 
-    def test_get_signals_returns_instance(self, qtbot: object) -> None:
+    def test_get_signals_returns_instance(self) -> None:
         """Test get_signals returns a signals instance."""
         signals = get_signals()
         assert isinstance(signals, AetherSignals)
 
-    def test_get_signals_returns_same_instance(self, qtbot: object) -> None:
+    def test_get_signals_returns_same_instance(self) -> None:
         """Test get_signals returns the same instance."""
         signals1 = get_signals()
         signals2 = get_signals()
         assert signals1 is signals2
 
-    def test_user_message_signal_exists(self, qtbot: object) -> None:
+    def test_user_message_signal_exists(self) -> None:
         """Test user_message_submitted signal exists."""
         signals = AetherSignals()
         assert hasattr(signals, "user_message_submitted")
 
-    def test_message_received_signal_exists(self, qtbot: object) -> None:
+    def test_message_received_signal_exists(self) -> None:
         """Test message_received signal exists."""
         signals = AetherSignals()
         assert hasattr(signals, "message_received")
 
-    def test_connection_state_signal_exists(self, qtbot: object) -> None:
+    def test_connection_state_signal_exists(self) -> None:
         """Test connection_state_changed signal exists."""
         signals = AetherSignals()
         assert hasattr(signals, "connection_state_changed")
 
-    def test_toast_requested_signal_exists(self, qtbot: object) -> None:
+    def test_toast_requested_signal_exists(self) -> None:
         """Test toast_requested signal exists."""
         signals = AetherSignals()
         assert hasattr(signals, "toast_requested")
@@ -190,7 +193,7 @@ class TestAetherSignals:
 class TestAetherSignalsMethods:
     """Test AetherSignals convenience methods."""
 
-    def test_show_toast_method(self, qtbot: object) -> None:
+    def test_show_toast_method(self) -> None:
         """Test show_toast convenience method."""
         signals = AetherSignals()
         received: list[ToastNotification] = []
@@ -205,7 +208,7 @@ class TestAetherSignalsMethods:
         assert received[0].message == "Test message"
         assert received[0].level == ToastLevel.INFO
 
-    def test_show_success_method(self, qtbot: object) -> None:
+    def test_show_success_method(self) -> None:
         """Test show_success convenience method."""
         signals = AetherSignals()
         received: list[ToastNotification] = []
@@ -216,7 +219,7 @@ class TestAetherSignalsMethods:
         assert len(received) == 1
         assert received[0].level == ToastLevel.SUCCESS
 
-    def test_show_error_method(self, qtbot: object) -> None:
+    def test_show_error_method(self) -> None:
         """Test show_error convenience method."""
         signals = AetherSignals()
         received: list[ToastNotification] = []
@@ -227,7 +230,7 @@ class TestAetherSignalsMethods:
         assert len(received) == 1
         assert received[0].level == ToastLevel.ERROR
 
-    def test_send_message_method(self, qtbot: object) -> None:
+    def test_send_message_method(self) -> None:
         """Test send_message convenience method."""
         signals = AetherSignals()
         received: list[ChatMessage] = []